@@ -0,0 +1,199 @@
+# Analytics class
+# Whole-vault passes (reindexing, word frequencies, dream sign pairs) split over several processes
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+
+# Classes
+from .catalog import scan_entries, parse_entry, TAG_PATTERN
+from .search import tokenize
+
+# Words too common to say anything about an entry
+STOP_WORDS = frozenset("""
+a about after again all also am an and any are as at be because been before being but by can
+could did do does doing down during each few for from further had has have having he her here
+hers herself him himself his how i if in into is it its itself just me more most my myself no
+nor not now of off on once only or other our ours out over own really same she should so some
+such than that the their theirs them themselves then there these they this those through to
+too under until up very was we were what when where which while who whom why will with would
+you your yours yourself
+""".split())
+
+# Each process gets about this many shards, so one slow shard doesn't hold up the rest
+SHARDS_PER_WORKER = 4
+
+def file_shards(directory, count):
+    """
+    Split the entries of a vault into shards of about the same size. The files are the
+    ones the catalog's refresh finds, wherever they sit in the vault.
+
+    Arguments:
+        directory (str): The journal directory.
+        count (int): How many shards to make at most.
+
+    Returns:
+        list: The shards, each a list of entry paths.
+    """
+    paths = [dir_entry.path for dir_entry in scan_entries(directory)]
+    size = -(-len(paths) // max(count, 1))
+    return [paths[start:start + size] for start in range(0, len(paths), size)]
+
+def read_shard(shard):
+    # Yields the text of every readable entry in a shard
+    for file_path in shard:
+        try:
+            with open(file_path, 'r') as file:
+                yield file.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+
+# | Mappers, these run in the worker processes |
+def parse_shard(shard):
+    """
+    Parse every entry of a shard for the catalog.
+
+    Arguments:
+        shard (list): Entry paths.
+
+    Returns:
+        list: Catalog records (see parse_entry).
+    """
+    records = []
+    for file_path in shard:
+        try:
+            records.append(parse_entry(file_path))
+        except (OSError, UnicodeDecodeError):
+            continue
+    return records
+
+def count_words(shard):
+    """
+    Count how often every word is used in a shard.
+
+    Arguments:
+        shard (list): Entry paths.
+
+    Returns:
+        Counter: {word: uses}
+    """
+    words = Counter()
+    for content in read_shard(shard):
+        # Tag markers like {Flying:5} are not part of the writing
+        content = TAG_PATTERN.sub(" ", content)
+        words.update({term: len(offsets) for term, offsets in tokenize(content).items()})
+    return words
+
+def count_sign_pairs(shard):
+    """
+    Count how often two dream signs show up in the same entry of a shard.
+
+    Arguments:
+        shard (list): Entry paths.
+
+    Returns:
+        Counter: {(sign, sign): entries}, each pair in alphabetical order.
+    """
+    pairs = Counter()
+    for content in read_shard(shard):
+        # Signs are matched case-insensitively, like in the catalog
+        signs = {tag.strip().lower(): tag.strip() for tag, _ in TAG_PATTERN.findall(content)}
+        signs = [signs[key] for key in sorted(signs)]
+        pairs.update(combinations(signs, 2))
+    return pairs
+
+class AnalyticsEngine:
+    def __init__(self, directory, workers=None):
+        """
+        Map a function over a vault's entries in separate processes and merge the results.
+
+        Arguments:
+            directory (str): The journal directory.
+            workers (int): How many processes to use, defaults to the number of cores.
+        """
+        self.directory = directory
+        self.workers = workers or os.cpu_count() or 1
+
+    def map_shards(self, mapper):
+        """
+        Run a mapper over every shard of the vault, yielding each result as soon as it is ready.
+
+        Arguments:
+            mapper (callable): A module level function taking a shard (a list of entry paths).
+
+        Yields:
+            object: Whatever the mapper returned, one per shard.
+        """
+        shards = file_shards(self.directory, self.workers * SHARDS_PER_WORKER)
+        if not shards:
+            return
+        if len(shards) == 1 or self.workers == 1:
+            # Not worth starting processes for
+            for shard in shards:
+                yield mapper(shard)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(shards))) as pool:
+            for future in as_completed([pool.submit(mapper, shard) for shard in shards]):
+                yield future.result()
+
+    def map_reduce(self, mapper):
+        """
+        Run a mapper over every shard and add up the Counters it returns.
+
+        Arguments:
+            mapper (callable): A module level function taking a shard and returning a Counter.
+
+        Returns:
+            Counter: The merged counts.
+        """
+        total = Counter()
+        for partial in self.map_shards(mapper):
+            total.update(partial)
+        return total
+
+    def word_frequencies(self, limit=None):
+        """
+        Rank the words used across the vault, leaving out stop words.
+
+        Arguments:
+            limit (int): How many words to return (all when None).
+
+        Returns:
+            list: (word, uses) tuples, most used first.
+        """
+        words = self.map_reduce(count_words)
+        for word in STOP_WORDS:
+            words.pop(word, None)
+        return words.most_common(limit)
+
+    def sign_pairs(self, limit=None):
+        """
+        Rank the pairs of dream signs that show up together in an entry.
+
+        Arguments:
+            limit (int): How many pairs to return (all when None).
+
+        Returns:
+            list: ((sign, sign), entries) tuples, most common first.
+        """
+        return self.map_reduce(count_sign_pairs).most_common(limit)
+
+    def reindex(self, catalog):
+        """
+        Rebuild a catalog from scratch, parsing the shards in parallel. The
+        sqlite writes happen here as every shard's records come back.
+
+        Arguments:
+            catalog (Catalog): The catalog of this engine's directory.
+
+        Returns:
+            int: The number of entries indexed.
+        """
+        return catalog.rebuild(
+            record for records in self.map_shards(parse_shard) for record in records
+        )
@@ -0,0 +1,731 @@
+# Backup class
+# Streams a vault's entries into a single backup file in one pass, compressing on the fly,
+# or into a tar archive that keeps the vault's folders, and keeps manifests so later backups
+# only need what changed
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import io
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import gzip
+import lzma
+import bz2
+import tarfile
+from collections import namedtuple
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Classes
+from .sync import ENTRY_DELIMITER, SEPARATOR, parse_sync_entry, read_sync_entries
+
+# The backup file is written through one buffer this big, instead of a write call per entry
+BUFFER_SIZE = 1024 * 1024
+
+TITLE_LINE = re.compile(r'\[ \((.*?)\) \| \((.*?)\) \]')
+
+# Some older entries have an overlong separator, backups use the normal one
+LONG_SEPARATOR = "─" * 104
+
+# Compression -> the extension added to the backup's name, plain text backups have none
+EXTENSIONS = {
+    "gzip": ".gz",
+    "xz": ".xz",
+    "bz2": ".bz2",
+}
+DEFAULT_LEVEL = 6
+
+# Restores write files on this many threads, creating the folders of this many files at a time
+DEFAULT_WRITERS = 8
+WRITE_BATCH_SIZE = 1024
+
+# Backup kinds: everything, what changed since the last backup, what changed since the last full backup
+FULL = "full"
+INCREMENTAL = "incremental"
+DIFFERENTIAL = "differential"
+
+# Backup formats: entries one after another like a sync file, or a tar of the vault's files
+TEXT = "text"
+TAR = "tar"
+FORMAT_SUFFIXES = {TEXT: ".txt", TAR: ".tar"}
+
+# Backup names start with their timestamp, down to the microsecond so two backups never share one
+TIMESTAMP_FORMAT = "%Y-%m-%d-%H-%M-%S-%f"
+
+# Written next to every backup, e.g. [timestamp]_Dream_Backup.txt.gz.manifest.json
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Written next to every tar backup, where each entry's bytes are in the archive
+ARCHIVE_INDEX_SUFFIX = ".index.json"
+
+# bytes is the size of the backup's text, compressed_bytes the size of the file on disk
+BackupStats = namedtuple("BackupStats", ["entries", "bytes", "compressed_bytes", "seconds"])
+
+def compression_of(file_path):
+    # Backups are recognised by their extension, anything else is read as plain text
+    for compression, extension in EXTENSIONS.items():
+        if file_path.endswith(extension):
+            return compression
+    return None
+
+def compressed_stream(raw, compression, mode, level=DEFAULT_LEVEL):
+    """
+    Wrap a binary file so what goes through it is compressed or decompressed.
+
+    Arguments:
+        raw (file): The binary file on disk.
+        compression (str): 'gzip', 'xz', 'bz2', or None for no compression.
+        mode (str): 'r' or 'w'.
+        level (int): How hard to compress (0-9), only used when writing.
+
+    Returns:
+        file: A binary file object.
+    """
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode=mode + "b", compresslevel=level)
+    if compression == "xz":
+        return lzma.LZMAFile(raw, mode + "b", preset=level if mode == "w" else None)
+    if compression == "bz2":
+        # bz2 has no level 0
+        return bz2.BZ2File(raw, mode + "b", compresslevel=max(level, 1))
+    return raw
+
+@contextmanager
+def open_backup(file_path, mode="r", level=DEFAULT_LEVEL, buffer_size=BUFFER_SIZE):
+    """
+    Open a backup as text, compressed according to its extension (see EXTENSIONS).
+
+    Arguments:
+        file_path (str): The backup file.
+        mode (str): 'r' or 'w'.
+        level (int): How hard to compress (0-9), only used when writing.
+        buffer_size (int): How many bytes are buffered between the disk and the compressor.
+
+    Yields:
+        tuple: (text file, raw file), the raw file's position is how far into the file on disk it got.
+    """
+    with open(file_path, mode + "b", buffering=buffer_size) as raw:
+        stream = compressed_stream(raw, compression_of(file_path), mode, level)
+        text = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+        try:
+            yield text, raw
+        finally:
+            # Flushes the compressor's last block before the raw file is closed
+            text.close()
+
+def backup_entry(content):
+    """
+    Format an entry the way it is stored in a backup: from its title line on.
+
+    Arguments:
+        content (str): The entry file's text.
+
+    Returns:
+        str: The entry's backup text, or None if it has no title line.
+    """
+    start = 0
+    while start < len(content):
+        end = content.find("\n", start) + 1 or len(content)
+        if content.startswith("[ (", start):
+            match = TITLE_LINE.search(content, start, end)
+            if match:
+                title_line = f"[ ({match.group(1)}) | ({match.group(2)}) ]\n"
+                return title_line + content[end:].replace(LONG_SEPARATOR, SEPARATOR)
+        start = end
+    return None
+
+def read_entries(file_paths):
+    # Yields the backup text of every readable entry, reading each file once
+    for file_path in file_paths:
+        try:
+            with open(file_path, 'r') as file:
+                content = file.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        entry = backup_entry(content)
+        if entry is not None:
+            yield entry
+
+def write_backup(file_paths, output_path, level=DEFAULT_LEVEL, buffer_size=BUFFER_SIZE):
+    """
+    Write every entry into one backup file, each one followed by the sync delimiter
+    so the backup can be loaded back with sync. The output is compressed as it is
+    written when its name ends in one of EXTENSIONS.
+
+    Arguments:
+        file_paths (iterable): The entries to back up.
+        output_path (str): The backup file to create.
+        level (int): How hard to compress (0-9).
+        buffer_size (int): How many bytes are buffered before they are written out.
+
+    Returns:
+        BackupStats: How many entries and bytes were written, and how long it took.
+    """
+    started = time.monotonic()
+    entries = 0
+
+    with open_backup(output_path, "w", level, buffer_size) as (output_file, _):
+        output_file.write(f"{ENTRY_DELIMITER}\n")
+        for entry in read_entries(file_paths):
+            output_file.write(entry)
+            output_file.write(f"\n\n{ENTRY_DELIMITER}\n")
+            entries += 1
+        output_file.flush()
+        # The compressors count what went into them, not what came out
+        written = output_file.buffer.tell()
+
+    return BackupStats(entries, written, os.path.getsize(output_path), time.monotonic() - started)
+
+def read_backup_entries(file_path, fields=None):
+    """
+    Stream the entries of a backup (or sync file) from the first one to the last,
+    decompressing as it goes. Entries without a body are skipped.
+
+    Arguments:
+        file_path (str): The backup file.
+        fields (dict): Header line prefixes -> the key they are stored under, e.g. DREAM_FIELDS.
+
+    Yields:
+        tuple: (entry, bytes of the file read so far)
+    """
+    with open_backup(file_path) as (backup_file, raw):
+        # Lines before the first delimiter aren't part of an entry
+        lines = None
+        for line in backup_file:
+            line = line.rstrip("\n")
+            if line.strip() != ENTRY_DELIMITER:
+                if lines is not None:
+                    lines.append(line)
+                continue
+
+            if lines:
+                entry = parse_sync_entry(lines, fields or {})
+                if entry["Body"]:
+                    yield entry, raw.tell()
+            lines = []
+
+        if lines:
+            entry = parse_sync_entry(lines, fields or {})
+            if entry["Body"]:
+                yield entry, raw.tell()
+
+def reverse_backup_entries(file_path, fields=None, buffer_size=BUFFER_SIZE):
+    """
+    Stream the entries of a compressed backup from the last one to the first, the
+    same order sync reads a plain file in. Compressed data can't be read backwards,
+    so it is decompressed into a temporary file first.
+
+    Arguments:
+        file_path (str): The backup file.
+        fields (dict): Header line prefixes -> the key they are stored under, e.g. DREAM_FIELDS.
+        buffer_size (int): How many bytes are decompressed at once.
+
+    Yields:
+        tuple: (entry, bytes of the backup file the entries so far came from)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        plain_path = os.path.join(directory, "backup.txt")
+        with open(file_path, "rb") as raw, open(plain_path, "wb") as plain:
+            shutil.copyfileobj(compressed_stream(raw, compression_of(file_path), "r"), plain, buffer_size)
+
+        # Progress is reported against the compressed file, which is what the caller knows the size of
+        size = os.path.getsize(file_path)
+        plain_size = max(os.path.getsize(plain_path), 1)
+        for entry, read in read_sync_entries(plain_path, fields):
+            yield entry, read * size // plain_size
+
+# | Restoring |
+def write_file(file_path, data, mtime=None):
+    # Runs in BulkWriter's threads
+    with open(file_path, 'wb' if isinstance(data, bytes) else 'w') as file:
+        file.write(data)
+    if mtime is not None:
+        os.utime(file_path, (mtime, mtime))
+    return file_path
+
+class BulkWriter:
+    def __init__(self, workers=DEFAULT_WRITERS):
+        """
+        Write a lot of small files quickly: their folders are made a batch at a time,
+        each folder only once, and the files are written by a pool of threads.
+
+        Arguments:
+            workers (int): How many files are written at once.
+        """
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.pending = set()
+        self.batch = []
+        self.folders = set()  # Folders known to exist
+        self.targets = set()  # Every path added so far
+        self.written = []
+        self.failed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def make_folders(self, folders):
+        for folder in set(folders) - self.folders:
+            os.makedirs(folder, exist_ok=True)
+            self.folders.add(folder)
+
+    def add(self, file_path, data, mtime=None):
+        """
+        Queue a file to be written.
+
+        Arguments:
+            file_path (str): Where to write it, its folder is created if needed.
+            data (bytes | str): What to write.
+            mtime (float): The modification time to give it, left as is when None.
+        """
+        self.targets.add(file_path)
+        self.batch.append((file_path, data, mtime))
+        if len(self.batch) >= WRITE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        # Every new folder of the batch first, so the threads only ever write files
+        self.make_folders(os.path.dirname(file_path) for file_path, _, _ in self.batch)
+        for item in self.batch:
+            # Keep a bounded number of writes in flight so the queued data doesn't pile up
+            if len(self.pending) >= self.workers * 4:
+                done, self.pending = wait(self.pending, return_when=FIRST_COMPLETED)
+                self._collect(done)
+            self.pending.add(self.pool.submit(write_file, *item))
+        self.batch = []
+
+    def _collect(self, done):
+        for future in done:
+            try:
+                self.written.append(future.result())
+            except OSError:
+                self.failed += 1
+
+    def close(self):
+        """
+        Write whatever is still queued and wait for every write to finish.
+        """
+        self.flush()
+        self._collect(wait(self.pending)[0])
+        self.pending = set()
+        self.pool.shutdown()
+
+# | Tar archives |
+def is_archive(file_path):
+    # e.g. [timestamp]_Dream_Backup.tar.gz
+    compression = compression_of(file_path)
+    stem = file_path[:-len(EXTENSIONS[compression])] if compression else file_path
+    return stem.endswith(FORMAT_SUFFIXES[TAR])
+
+class SegmentWriter:
+    def __init__(self, raw, compression, level=DEFAULT_LEVEL):
+        """
+        What tarfile writes into. A compressed archive is split into segments that are
+        compressed independently, so one can be decompressed without the ones before it.
+        The segments are back to back streams, which gzip, xz and bz2 all read as one.
+
+        Arguments:
+            raw (file): The binary file on disk.
+            compression (str): 'gzip', 'xz', 'bz2', or None for a plain tar.
+            level (int): How hard to compress (0-9).
+        """
+        self.raw = raw
+        self.compression = compression
+        self.level = level
+        self.stream = compressed_stream(raw, compression, "w", level)
+        self.segment_start = raw.tell()  # Where the current segment starts on disk
+        self.segment_position = 0  # Uncompressed bytes written to the current segment
+        self.position = 0  # Uncompressed bytes written in total
+
+    def start_segment(self):
+        # A plain tar is one segment, its offsets already point straight into the file
+        if self.compression is None:
+            return
+        self.stream.close()
+        self.segment_start = self.raw.tell()
+        self.segment_position = 0
+        self.stream = compressed_stream(self.raw, self.compression, "w", self.level)
+
+    def write(self, data):
+        self.stream.write(data)
+        self.segment_position += len(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        if self.stream is not self.raw:
+            self.stream.close()
+
+def write_archive(file_paths, directory, output_path, level=DEFAULT_LEVEL, buffer_size=BUFFER_SIZE):
+    """
+    Write entries into a tar archive under their paths in the vault, with a new
+    segment for every month, and save where each entry's bytes ended up next to it.
+
+    Arguments:
+        file_paths (iterable): The entries to back up, grouped by month (e.g. sorted by date).
+        directory (str): The vault's journal directory, archive paths are relative to it.
+        output_path (str): The archive to create, compressed when its name ends in one of EXTENSIONS.
+        level (int): How hard to compress (0-9).
+        buffer_size (int): How many bytes are buffered before they are written out.
+
+    Returns:
+        BackupStats: How many entries and bytes were written, and how long it took.
+    """
+    started = time.monotonic()
+    compression = compression_of(output_path)
+    # Archive path -> [segment start on disk, offset in the segment, size, mtime]
+    index = {}
+
+    with open(output_path, "wb", buffering=buffer_size) as raw:
+        segments = SegmentWriter(raw, compression, level)
+        with tarfile.open(fileobj=segments, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            month = None
+            for file_path in file_paths:
+                try:
+                    with open(file_path, 'rb') as file:
+                        data = file.read()
+                        stat = os.fstat(file.fileno())
+                except OSError:
+                    continue
+
+                archive_path = os.path.relpath(file_path, directory).replace(os.sep, "/")
+                # year/month/day/name.txt
+                folder = archive_path.rsplit("/", 2)[0]
+                if folder != month:
+                    segments.start_segment()
+                    month = folder
+
+                info = tarfile.TarInfo(archive_path)
+                info.size = len(data)
+                info.mtime = stat.st_mtime
+                info.mode = stat.st_mode & 0o777
+                tar.addfile(info, io.BytesIO(data))
+
+                # The data sits right before the padding that rounds the member up to a block
+                padded = -(-len(data) // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                index[archive_path] = [
+                    segments.segment_start, segments.segment_position - padded, len(data), stat.st_mtime
+                ]
+        segments.close()
+
+    with open(output_path + ARCHIVE_INDEX_SUFFIX, 'w') as file:
+        json.dump({"compression": compression, "entries": index}, file)
+
+    return BackupStats(len(index), segments.position, os.path.getsize(output_path), time.monotonic() - started)
+
+class ArchiveIndex:
+    def __init__(self, archive_path):
+        """
+        Read single entries or folders out of a tar backup by seeking to them, using
+        the index written next to it. Only the segments holding them are decompressed.
+
+        Arguments:
+            archive_path (str): The tar backup.
+
+        Raises:
+            FileNotFoundError: If the archive has no index.
+        """
+        self.archive_path = archive_path
+        self.compression = compression_of(archive_path)
+        with open(archive_path + ARCHIVE_INDEX_SUFFIX, 'r') as file:
+            self.entries = json.load(file)["entries"]
+
+    def select(self, selection=None):
+        """
+        Pick the entries to extract.
+
+        Arguments:
+            selection (str): An entry's path in the archive, or a folder like '2024' or
+                             '2024/March'. Everything when None or empty.
+
+        Returns:
+            list: Archive paths.
+        """
+        if not selection:
+            return list(self.entries)
+        selection = selection.strip("/")
+        return [
+            archive_path for archive_path in self.entries
+            if archive_path == selection or archive_path.startswith(selection + "/")
+        ]
+
+    def read(self, archive_paths):
+        """
+        Read entries in the order they sit in the archive.
+
+        Arguments:
+            archive_paths (iterable): Paths from select().
+
+        Yields:
+            tuple: (archive path, bytes, mtime)
+        """
+        records = sorted((self.entries[archive_path], archive_path) for archive_path in archive_paths)
+        with open(self.archive_path, 'rb') as raw:
+            segment, stream = None, None
+            for (start, offset, size, mtime), archive_path in records:
+                if self.compression is None:
+                    raw.seek(start + offset)
+                    yield archive_path, raw.read(size), mtime
+                    continue
+
+                if start != segment:
+                    raw.seek(start)
+                    stream = compressed_stream(raw, self.compression, "r")
+                    segment = start
+                # Offsets only go up within a segment, so this decompresses forward to the entry
+                stream.seek(offset)
+                yield archive_path, stream.read(size), mtime
+
+    def extract(self, directory, selection=None, overwrite=False, writer=None):
+        """
+        Write entries back into the vault under their original paths.
+
+        Arguments:
+            directory (str): The vault's journal directory.
+            selection (str): What to extract, see select().
+            overwrite (bool): Whether to replace entries that are already there, or
+                              that the writer was already given.
+            writer (BulkWriter): Where to queue the files, e.g. one shared by every backup
+                                 of a restore. A writer is made and finished here when None.
+
+        Returns:
+            list: The paths of the files that were queued.
+        """
+        root = os.path.abspath(directory)
+        targets = {}
+        for archive_path in self.select(selection):
+            target = os.path.join(directory, *archive_path.split("/"))
+            # Never write outside the vault, whatever the index says
+            if os.path.commonpath([root, os.path.abspath(target)]) != root:
+                continue
+            if overwrite or not (os.path.exists(target) or (writer and target in writer.targets)):
+                targets[archive_path] = target
+
+        own_writer = writer is None
+        writer = writer or BulkWriter()
+        # Every folder in one go, before any file
+        writer.make_folders(os.path.dirname(target) for target in targets.values())
+        for archive_path, data, mtime in self.read(targets):
+            writer.add(targets[archive_path], data, mtime)
+        if own_writer:
+            writer.close()
+        return list(targets.values())
+
+def file_hash(file_path):
+    with open(file_path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+class BackupSet:
+    def __init__(self, backup_directory, directory, label):
+        """
+        The backups of one vault, tied together by the manifests written next to them.
+        A manifest lists every entry (path, size, mtime, content hash) at the time of its
+        backup, and names the backup it was taken against.
+
+        Arguments:
+            backup_directory (str): Where the backups are written.
+            directory (str): The vault's journal directory, manifest paths are relative to it.
+            label (str): Tells this vault's backups apart, e.g. 'Dream' for [timestamp]_Dream_Backup.txt
+        """
+        self.backup_directory = backup_directory
+        self.directory = directory
+        self.prefix = f"_{label}_Backup"
+
+    # | Manifests |
+    def manifest_paths(self):
+        """
+        List this vault's manifests.
+
+        Returns:
+            list: Manifest paths, oldest backup first (the names start with their timestamp).
+        """
+        try:
+            names = os.listdir(self.backup_directory)
+        except FileNotFoundError:
+            return []
+        return [
+            os.path.join(self.backup_directory, name) for name in sorted(names)
+            if name.endswith(MANIFEST_SUFFIX) and self.prefix in name
+        ]
+
+    def load(self, manifest_path):
+        with open(manifest_path, 'r') as file:
+            return json.load(file)
+
+    def latest(self, kind=None):
+        """
+        Get the newest manifest, optionally of one kind only.
+
+        Arguments:
+            kind (str): FULL, INCREMENTAL or DIFFERENTIAL, any kind when None.
+
+        Returns:
+            dict: The manifest, or None if there is no such backup.
+        """
+        for manifest_path in reversed(self.manifest_paths()):
+            manifest = self.load(manifest_path)
+            if kind is None or manifest["kind"] == kind:
+                return manifest
+        return None
+
+    def snapshot(self, file_paths, previous=None):
+        """
+        Describe every entry for a manifest. Entries whose size and mtime match the
+        previous manifest keep its hash, so only new and touched files are read.
+
+        Arguments:
+            file_paths (iterable): The vault's entry paths.
+            previous (dict): The last manifest's entries, if there is one.
+
+        Returns:
+            dict: {path relative to the vault: [size, mtime in ns, content hash]}
+        """
+        previous = previous or {}
+        entries = {}
+        for file_path in file_paths:
+            try:
+                stat = os.stat(file_path)
+                relative_path = os.path.relpath(file_path, self.directory)
+                known = previous.get(relative_path)
+                if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+                    content_hash = known[2]
+                else:
+                    content_hash = file_hash(file_path)
+            except OSError:
+                continue  # Removed since it was listed
+            entries[relative_path] = [stat.st_size, stat.st_mtime_ns, content_hash]
+        return entries
+
+    # | Writing |
+    def backup_name(self, backup_format=TEXT, compression=None):
+        """
+        Name a new backup after the current time. A name already taken by one of this
+        vault's backups (of any format) moves on to the next free microsecond, so a
+        manifest can never end up naming itself as its base.
+
+        Arguments:
+            backup_format (str): TEXT or TAR.
+            compression (str): 'gzip', 'xz', 'bz2', or None for plain text.
+
+        Returns:
+            str: The backup's file name.
+        """
+        try:
+            taken = os.listdir(self.backup_directory)
+        except FileNotFoundError:
+            taken = []
+
+        moment = datetime.now()
+        while True:
+            stem = f"[{moment.strftime(TIMESTAMP_FORMAT)}]{self.prefix}"
+            if not any(name.startswith(stem) for name in taken):
+                return f"{stem}{FORMAT_SUFFIXES[backup_format]}{EXTENSIONS.get(compression, '')}"
+            moment += timedelta(microseconds=1)
+
+    def create(self, file_paths, kind=FULL, compression=None, level=DEFAULT_LEVEL, backup_format=TEXT):
+        """
+        Write a backup and its manifest. Incremental backups hold the entries added or
+        changed since the last backup, differential ones those since the last full backup.
+        Either falls back to a full backup when there is nothing to build on.
+
+        Arguments:
+            file_paths (list): The vault's entry paths, in the order they are backed up.
+            kind (str): FULL, INCREMENTAL or DIFFERENTIAL.
+            compression (str): 'gzip', 'xz', 'bz2', or None for plain text.
+            level (int): How hard to compress (0-9).
+            backup_format (str): TEXT or TAR.
+
+        Returns:
+            tuple: (backup path, kind written, BackupStats), the path is None when nothing changed.
+        """
+        latest = self.latest()
+        base = latest if kind == INCREMENTAL else self.latest(FULL)
+        if kind == FULL or base is None:
+            kind, base = FULL, None
+
+        entries = self.snapshot(file_paths, latest["entries"] if latest else None)
+        if base is not None:
+            # Compare content hashes, an entry that was only touched isn't backed up again
+            changed = []
+            for file_path in file_paths:
+                relative_path = os.path.relpath(file_path, self.directory)
+                if relative_path not in entries:
+                    continue
+                known = base["entries"].get(relative_path)
+                if known is None or known[2] != entries[relative_path][2]:
+                    changed.append(file_path)
+            file_paths = changed
+            if not file_paths:
+                return None, kind, BackupStats(0, 0, 0, 0)
+
+        backup_name = self.backup_name(backup_format, compression)
+        backup_path = os.path.join(self.backup_directory, backup_name)
+        if backup_format == TAR:
+            stats = write_archive(file_paths, self.directory, backup_path, level)
+        else:
+            stats = write_backup(file_paths, backup_path, level)
+
+        manifest = {
+            "backup": backup_name,
+            "kind": kind,
+            "base": base["backup"] if base else None,
+            "entries": entries,
+        }
+        # Written to the side first, a half written manifest would break the chain
+        manifest_path = backup_path + MANIFEST_SUFFIX
+        with open(manifest_path + ".tmp", 'w') as file:
+            json.dump(manifest, file)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+        return backup_path, kind, stats
+
+    # | Restoring |
+    def chain(self, backup_name=None):
+        """
+        Find the backups needed to restore a backup: its full backup, then every
+        backup in between, following the manifests' base links.
+
+        Arguments:
+            backup_name (str): The backup to restore, the newest one when None.
+
+        Returns:
+            list: Backup paths, the full backup first. Empty if there are no backups.
+
+        Raises:
+            FileNotFoundError: If a backup or manifest of the chain is missing.
+            ValueError: If the base links loop back to a backup already in the chain.
+        """
+        if backup_name is None:
+            latest = self.latest()
+            if latest is None:
+                return []
+            backup_name = latest["backup"]
+
+        chain = []
+        seen = set()
+        while backup_name:
+            if backup_name in seen:
+                raise ValueError(f"The backup chain loops back to {backup_name}")
+            seen.add(backup_name)
+
+            backup_path = os.path.join(self.backup_directory, backup_name)
+            if not os.path.exists(backup_path):
+                raise FileNotFoundError(f"{backup_name} is missing from the backup chain")
+            if not os.path.exists(backup_path + MANIFEST_SUFFIX):
+                raise FileNotFoundError(f"The manifest of {backup_name} is missing from the backup chain")
+            chain.append(backup_path)
+            backup_name = self.load(backup_path + MANIFEST_SUFFIX)["base"]
+        return chain[::-1]
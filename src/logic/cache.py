@@ -0,0 +1,123 @@
+# Cache class
+# Keeps recently parsed entries in memory and reads the ones around the current entry ahead of time
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import queue
+import threading
+from collections import OrderedDict
+
+class EntryCache:
+    def __init__(self, loader, max_entries=256, max_bytes=8 * 1024 * 1024):
+        """
+        A least recently used cache of parsed entries, bounded by count and by size.
+
+        Arguments:
+            loader (callable): Takes a path and returns (parsed entry, size in bytes).
+            max_entries (int): How many entries are kept at most.
+            max_bytes (int): How many bytes of entries are kept at most.
+        """
+        self.loader = loader
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # path -> (entry, size), least recently used first
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        # Bumped on every invalidation so a prefetch started before it doesn't store stale text
+        self.generation = 0
+
+        # Paths waiting to be prefetched, only the latest batch matters
+        self.pending = queue.Queue()
+        self.worker = None
+
+    def _store(self, path, entry, size, generation=None):
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            if path in self.entries:
+                self.total_bytes -= self.entries.pop(path)[1]
+            self.entries[path] = (entry, size)
+            self.total_bytes += size
+
+            # Evict the least recently used entries, always keeping the newest one
+            while len(self.entries) > 1 and (
+                len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+    def get(self, path):
+        """
+        Get a parsed entry, loading it if it is not cached.
+
+        Arguments:
+            path (str): The entry's path.
+
+        Returns:
+            object: The parsed entry.
+
+        Raises:
+            OSError: If the entry can't be read.
+        """
+        with self.lock:
+            if path in self.entries:
+                self.entries.move_to_end(path)
+                return self.entries[path][0]
+
+        entry, size = self.loader(path)
+        self._store(path, entry, size)
+        return entry
+
+    def invalidate(self, path):
+        """
+        Forget an entry, e.g. after it was edited or deleted.
+
+        Arguments:
+            path (str): The entry's path.
+        """
+        with self.lock:
+            self.generation += 1
+            if path in self.entries:
+                self.total_bytes -= self.entries.pop(path)[1]
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.total_bytes = 0
+
+    # | Prefetching |
+    def prefetch(self, paths):
+        """
+        Load entries in the background, replacing whatever was still waiting to be loaded.
+
+        Arguments:
+            paths (list): The paths to load, most wanted first.
+        """
+        # Drop the stale batch, the user has already moved on from it
+        while True:
+            try:
+                self.pending.get_nowait()
+            except queue.Empty:
+                break
+        for path in paths:
+            self.pending.put(path)
+
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._prefetch_loop, daemon=True)
+            self.worker.start()
+
+    def _prefetch_loop(self):
+        while True:
+            path = self.pending.get()
+            with self.lock:
+                cached = path in self.entries
+                generation = self.generation
+            if cached:
+                continue
+            try:
+                entry, size = self.loader(path)
+            except Exception:
+                continue  # The navigator reports unreadable entries when it gets to them
+            self._store(path, entry, size, generation)
@@ -0,0 +1,670 @@
+# Catalog class
+# Keeps a persistent sqlite index of every entry inside a journal directory
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import os
+import re
+import sqlite3
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+# Classes
+from .utils import Helpers, HEADER_FIELDS
+from .streaks import DayIndex
+
+# The catalog lives next to the vault, e.g. '../data/dreams' -> '../data/dreams.catalog.db'
+CATALOG_SUFFIX = ".catalog.db"
+
+# How many files are read at once when scanning, overridden by 'scan_workers' in settings.json
+DEFAULT_WORKERS = 8
+
+# How many parsed entries are written to sqlite together, each table gets one statement per batch
+INSERT_BATCH = 500
+
+# Bump this whenever the tables change, old catalogs are then rebuilt from scratch
+SCHEMA_VERSION = 11
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    title TEXT,
+    date TEXT,
+    created INTEGER,
+    dream_type TEXT,
+    technique TEXT,
+    sleep_cycle TEXT,
+    mtime INTEGER,
+    size INTEGER,
+    inode INTEGER,
+    fingerprint TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_order ON entries (date DESC, created DESC);
+CREATE INDEX IF NOT EXISTS entries_fingerprint ON entries (fingerprint);
+CREATE TABLE IF NOT EXISTS date_counts (
+    date TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS entries_counted AFTER INSERT ON entries WHEN NEW.date IS NOT NULL BEGIN
+    INSERT INTO date_counts (date, count) VALUES (NEW.date, 1)
+    ON CONFLICT (date) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_uncounted AFTER DELETE ON entries WHEN OLD.date IS NOT NULL BEGIN
+    UPDATE date_counts SET count = count - 1 WHERE date = OLD.date;
+    DELETE FROM date_counts WHERE date = OLD.date AND count <= 0;
+END;
+CREATE TABLE IF NOT EXISTS tags (
+    entry_id INTEGER NOT NULL REFERENCES entries (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    percent INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tags_entry ON tags (entry_id);
+CREATE INDEX IF NOT EXISTS tags_sign ON tags (tag, percent);
+CREATE TABLE IF NOT EXISTS sign_counts (
+    tag TEXT PRIMARY KEY COLLATE NOCASE,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sign_counts_order ON sign_counts (count DESC);
+CREATE TRIGGER IF NOT EXISTS tags_counted AFTER INSERT ON tags BEGIN
+    INSERT INTO sign_counts (tag, count) VALUES (NEW.tag, 1)
+    ON CONFLICT (tag) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS tags_uncounted AFTER DELETE ON tags BEGIN
+    UPDATE sign_counts SET count = count - 1 WHERE tag = OLD.tag;
+    DELETE FROM sign_counts WHERE tag = OLD.tag AND count <= 0;
+END;
+CREATE TABLE IF NOT EXISTS fields (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL COLLATE NOCASE,
+    entry_id INTEGER NOT NULL REFERENCES entries (id) ON DELETE CASCADE,
+    PRIMARY KEY (field, value, entry_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS fields_entry ON fields (entry_id);
+CREATE TABLE IF NOT EXISTS field_counts (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL COLLATE NOCASE,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (field, value)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS fields_counted AFTER INSERT ON fields BEGIN
+    INSERT INTO field_counts (field, value, count) VALUES (NEW.field, NEW.value, 1)
+    ON CONFLICT (field, value) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS fields_uncounted AFTER DELETE ON fields BEGIN
+    UPDATE field_counts SET count = count - 1 WHERE field = OLD.field AND value = OLD.value;
+    DELETE FROM field_counts WHERE field = OLD.field AND value = OLD.value AND count <= 0;
+END;
+CREATE VIRTUAL TABLE IF NOT EXISTS contents USING fts5 (content, tokenize = 'trigram', detail = 'none');
+CREATE VIRTUAL TABLE IF NOT EXISTS words USING fts5 (
+    content, content = 'contents', tokenize = "unicode61 remove_diacritics 0 tokenchars '_'"
+);
+CREATE TRIGGER IF NOT EXISTS entries_unsearched AFTER DELETE ON entries BEGIN
+    INSERT INTO words (words, rowid, content) SELECT 'delete', rowid, content FROM contents WHERE rowid = OLD.id;
+    DELETE FROM contents WHERE rowid = OLD.id;
+END;
+"""
+
+# 'trigrams' and 'postings' are only dropped, they come from catalogs older than the fts5 tables
+TABLES = [
+    "words", "contents", "trigrams", "postings", "field_counts", "fields",
+    "sign_counts", "tags", "date_counts", "entries",
+]
+
+# Metadata columns that can hold several comma separated values, e.g. 'Lucid, Vivid'
+FIELDS = ["dream_type", "technique", "sleep_cycle"]
+
+TAG_PATTERN = re.compile(r'\{(.*?):(\d+)\}')
+
+# The '[ Dream Entry ]' / '[ Journal Entry ]' line above an entry's body
+ENTRY_MARKER = re.compile(r'^\[ \w+ Entry \]$')
+
+def catalog_path(directory):
+    """
+    Get the path of the catalog database for a journal directory.
+
+    Arguments:
+        directory (str): The journal directory.
+
+    Returns:
+        str: The path of the sqlite database next to the directory.
+    """
+    return os.path.normpath(directory) + CATALOG_SUFFIX
+
+def directory_date(file_path):
+    """
+    Get the date of an entry from its year/MonthName/day folders.
+
+    Arguments:
+        file_path (str): The entry's path.
+
+    Returns:
+        str: The date as YYYY-MM-DD, or None if the folders are not a date.
+    """
+    parts = os.path.normpath(os.path.dirname(file_path)).split(os.sep)
+    try:
+        year = int(parts[-3])
+        month = datetime.strptime(parts[-2], "%B").month
+        day = int(parts[-1])
+        return datetime(year, month, day).strftime("%Y-%m-%d")
+    except (IndexError, ValueError):
+        return None
+
+def scan_entries(directory):
+    """
+    Recursively yield the .txt entries in a directory without opening them.
+
+    Arguments:
+        directory (str): The directory to scan.
+
+    Yields:
+        os.DirEntry: One per entry file.
+    """
+    try:
+        with os.scandir(directory) as iterator:
+            for dir_entry in iterator:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    yield from scan_entries(dir_entry.path)
+                elif dir_entry.name.endswith(".txt") and dir_entry.is_file():
+                    yield dir_entry
+    except FileNotFoundError:
+        return
+
+def file_signature(stat):
+    # What we compare to decide whether a file changed since it was catalogued
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+def entry_body(content):
+    """
+    Get the text an entry was written with, below its header.
+
+    Arguments:
+        content (str): The entry's text.
+
+    Returns:
+        str: The body.
+    """
+    lines = content.split("\n")[1:]
+    start = 0
+    # Skip the separators, the Dream Type/Technique/Sleep Cycle lines and the entry marker
+    while start < len(lines):
+        line = lines[start].strip()
+        if line and not line.startswith("─") and line.partition(":")[0] not in HEADER_FIELDS and not ENTRY_MARKER.match(line):
+            break
+        start += 1
+    return "\n".join(lines[start:])
+
+def content_fingerprint(content):
+    """
+    Hash an entry's body (ignoring case and whitespace) with its dream type, technique and
+    sleep cycle. The title and date are left out, so a re-import under another title or
+    a corrected date still has the same fingerprint.
+
+    Arguments:
+        content (str): The entry's text.
+
+    Returns:
+        str: The fingerprint, or None if the entry has nothing written yet.
+    """
+    body = " ".join(entry_body(content).split()).casefold()
+    # Fresh entries only hold '[]', they are not duplicates of each other
+    if not re.search(r"\w", body):
+        return None
+    header = Helpers.parse_header(content)
+    metadata = "|".join(
+        " ".join(value.split()).casefold() for value in (header.dream_type, header.technique, header.sleep_cycle)
+    )
+    return hashlib.sha1(f"{metadata}\0{body}".encode("utf-8")).hexdigest()
+
+def parse_entry(file_path, stat=None):
+    """
+    Read an entry and pull out everything the catalog stores about it.
+
+    Arguments:
+        file_path (str): The entry's path.
+        stat (os.stat_result): The file's stat, looked up when not given.
+
+    Returns:
+        dict: The entry's catalog row, with its tags under 'tags' and its text under 'content'.
+    """
+    with open(file_path, 'r') as file:
+        content = file.read()
+    stat = stat or os.stat(file_path)
+
+    header = Helpers.parse_header(content)
+    record = {
+        "path": file_path,
+        "title": header.title,
+        "date": None,
+        "created": Helpers.extract_creation_time(os.path.basename(file_path)),
+        "dream_type": header.dream_type,
+        "technique": header.technique,
+        "sleep_cycle": header.sleep_cycle,
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "inode": stat.st_ino,
+    }
+
+    # Dates are stored as YYYY-MM-DD so they sort, falling back on the folders
+    try:
+        record["date"] = datetime.strptime(header.date, "%d %B, %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        record["date"] = directory_date(file_path)
+
+    record["tags"] = [(tag, int(percent)) for tag, percent in TAG_PATTERN.findall(content)]
+    record["fingerprint"] = content_fingerprint(content)
+    record["content"] = content
+    return record
+
+def load_changed(dir_entry, signature):
+    """
+    Parse an entry if it changed since it was catalogued, run on the scan's worker threads.
+
+    Arguments:
+        dir_entry (os.DirEntry): The entry file.
+        signature (tuple): The catalogued signature, None if the entry is new.
+
+    Returns:
+        dict: The parsed entry (see parse_entry), or None if it did not change.
+    """
+    stat = dir_entry.stat()
+    if signature == file_signature(stat):
+        return None
+    return parse_entry(dir_entry.path, stat)
+
+class Catalog:
+    def __init__(self, directory, workers=DEFAULT_WORKERS):
+        """
+        Open (or create) the catalog for a journal directory.
+
+        Arguments:
+            directory (str): The journal directory to index.
+            workers (int): How many files are stat'ed and read at once when scanning.
+        """
+        self.directory = directory
+        self.workers = max(1, workers)
+        self.path = catalog_path(directory)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self._create_schema()
+        # Built on first use by day_index(), then kept up to date by every write
+        self._days = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _create_schema(self):
+        """
+        Create the tables, dropping them first if they come from an older version.
+        """
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        with self.connection:
+            if version != SCHEMA_VERSION:
+                for table in TABLES:
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.connection.close()
+
+    # | Writing |
+    def _delete(self, file_path):
+        # Returns the removed entry's date so the day index can be updated
+        row = self.connection.execute("SELECT date FROM entries WHERE path = ?", (file_path,)).fetchone()
+        self.connection.execute("DELETE FROM entries WHERE path = ?", (file_path,))
+        return row["date"] if row else None
+
+    def _update_days(self, dates):
+        """
+        Set or clear the day index bits of the days whose entries changed.
+
+        Arguments:
+            dates (iterable): The changed days (YYYY-MM-DD, None is skipped).
+        """
+        if self._days is None:
+            return
+        for date in set(dates):
+            if date is None:
+                continue
+            if self.connection.execute("SELECT 1 FROM date_counts WHERE date = ?", (date,)).fetchone():
+                self._days.add(date)
+            else:
+                self._days.remove(date)
+
+    def _insert(self, records):
+        """
+        Write parsed entries with one statement per table for the whole batch. The
+        ids are handed out here so the rows of every table can be built before
+        anything is written.
+
+        Arguments:
+            records (list): Catalog records (see parse_entry), their paths must not be in the catalog.
+        """
+        if not records:
+            return
+        next_id = self.connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM entries").fetchone()[0]
+        for offset, record in enumerate(records):
+            record["id"] = next_id + offset
+
+        self.connection.executemany(
+            "INSERT INTO entries (id, path, title, date, created, dream_type, technique, sleep_cycle, mtime, size, inode, fingerprint) "
+            "VALUES (:id, :path, :title, :date, :created, :dream_type, :technique, :sleep_cycle, :mtime, :size, :inode, :fingerprint)",
+            records
+        )
+        self.connection.executemany(
+            "INSERT INTO tags (entry_id, tag, percent) VALUES (?, ?, ?)",
+            [(record["id"], tag, percent) for record in records for tag, percent in record["tags"]]
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO fields (field, value, entry_id) VALUES (?, ?, ?)",
+            [
+                (field, value, record["id"])
+                for record in records
+                for field in FIELDS
+                for value in record[field].split(", ") if value
+            ]
+        )
+        # The text with its trigram index, and the word index read from that same text
+        contents = [(record["id"], record["content"]) for record in records]
+        self.connection.executemany("INSERT INTO contents (rowid, content) VALUES (?, ?)", contents)
+        self.connection.executemany("INSERT INTO words (rowid, content) VALUES (?, ?)", contents)
+
+    def rebuild(self, records):
+        """
+        Replace everything in the catalog with already parsed entries.
+
+        Arguments:
+            records (iterable): Catalog records (see parse_entry).
+
+        Returns:
+            int: The number of entries indexed.
+        """
+        count = 0
+        batch = []
+        with self.connection:
+            # Emptied in one go, instead of the delete trigger unindexing every entry's words
+            self.connection.execute("INSERT INTO words (words) VALUES ('delete-all')")
+            self.connection.execute("DELETE FROM contents")
+            self.connection.execute("DELETE FROM entries")
+            for record in records:
+                batch.append(record)
+                if len(batch) >= INSERT_BATCH:
+                    self._insert(batch)
+                    count += len(batch)
+                    batch = []
+            self._insert(batch)
+            count += len(batch)
+        self._days = None
+        return count
+
+    def refresh(self, progress=None):
+        """
+        Bring the catalog up to date with the directory. Every file is only
+        stat'ed, and just the ones whose mtime, size or inode changed are read again.
+        The stats and reads run on a thread pool while the directories are still being
+        walked, the sqlite writes stay on this thread and go out INSERT_BATCH entries at a time.
+
+        Arguments:
+            progress (callable): Called with (files checked, files found) as the scan goes.
+
+        Returns:
+            tuple: The number of entries (added, updated, removed).
+        """
+        known = {
+            row["path"]: (row["mtime"], row["size"], row["inode"])
+            for row in self.connection.execute("SELECT path, mtime, size, inode FROM entries")
+        }
+        added = updated = 0
+        changed_dates = []
+        found = checked = 0
+        batch = []
+
+        def store(done):
+            nonlocal added, updated, checked, batch
+            for future in done:
+                signature = pending.pop(future)
+                checked += 1
+                try:
+                    record = future.result()
+                except (OSError, UnicodeDecodeError):
+                    continue  # Unreadable files are left out of the catalog
+                if record is None:
+                    continue
+
+                if signature is None:
+                    added += 1
+                else:
+                    changed_dates.append(self._delete(record["path"]))
+                    updated += 1
+                batch.append(record)
+                changed_dates.append(record["date"])
+            if len(batch) >= INSERT_BATCH:
+                self._insert(batch)
+                batch = []
+            if progress:
+                progress(checked, found)
+
+        with self.connection, ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {}
+            for dir_entry in scan_entries(self.directory):
+                found += 1
+                signature = known.pop(dir_entry.path, None)
+                pending[pool.submit(load_changed, dir_entry, signature)] = signature
+                # Keep a bounded number of parsed entries waiting, writing the finished ones
+                if len(pending) >= self.workers * 4:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    store(done)
+            store(list(pending))
+            self._insert(batch)
+
+            # Whatever is left was not found on disk anymore
+            for path in known:
+                changed_dates.append(self._delete(path))
+
+        self._update_days(changed_dates)
+        return added, updated, len(known)
+
+    def index_file(self, file_path):
+        """
+        Add an entry to the catalog, or re-read it if it is already there.
+
+        Arguments:
+            file_path (str): The entry's path.
+        """
+        record = parse_entry(file_path)
+        with self.connection:
+            old_date = self._delete(file_path)
+            self._insert([record])
+        self._update_days([old_date, record["date"]])
+
+    def index_files(self, file_paths):
+        """
+        Add several entries to the catalog (or re-read them) in a single transaction.
+
+        Arguments:
+            file_paths (list): The entries' paths.
+        """
+        records = [parse_entry(file_path) for file_path in file_paths]
+        changed_dates = []
+        with self.connection:
+            for record in records:
+                changed_dates.append(self._delete(record["path"]))
+                changed_dates.append(record["date"])
+            self._insert(records)
+        self._update_days(changed_dates)
+
+    def remove(self, file_path):
+        """
+        Drop an entry from the catalog.
+
+        Arguments:
+            file_path (str): The entry's path.
+        """
+        with self.connection:
+            date = self._delete(file_path)
+        self._update_days([date])
+
+    # | Reading |
+    def is_empty(self):
+        return self.connection.execute("SELECT 1 FROM entries LIMIT 1").fetchone() is None
+
+    def list_paths(self):
+        """
+        List every entry path, newest first.
+
+        Returns:
+            list: Sorted list of file paths.
+        """
+        rows = self.connection.execute(
+            "SELECT path FROM entries ORDER BY date DESC, created DESC, path DESC"
+        )
+        return [row["path"] for row in rows]
+
+    def order_keys(self):
+        """
+        Get what the navigator sorts entries by, for every entry.
+
+        Returns:
+            list: (path, date, created) tuples.
+        """
+        return [tuple(row) for row in self.connection.execute("SELECT path, date, created FROM entries")]
+
+    def order_key(self, file_path):
+        """
+        Get what the navigator sorts an entry by.
+
+        Arguments:
+            file_path (str): The entry's path.
+
+        Returns:
+            tuple: (path, date, created), or None if the entry is not in the catalog.
+        """
+        row = self.connection.execute(
+            "SELECT path, date, created FROM entries WHERE path = ?", (file_path,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def records(self, start_date=None, end_date=None):
+        """
+        Get the catalog rows, newest first, optionally limited to a date range.
+
+        Arguments:
+            start_date (str): First date (YYYY-MM-DD) to include.
+            end_date (str): Last date (YYYY-MM-DD) to include.
+
+        Returns:
+            list: sqlite3.Row objects with the entry's columns.
+        """
+        query = "SELECT * FROM entries"
+        params = []
+        if start_date and end_date:
+            query += " WHERE date BETWEEN ? AND ?"
+            params = [start_date, end_date]
+        query += " ORDER BY date DESC, created DESC, path DESC"
+        return self.connection.execute(query, params).fetchall()
+
+    def field_counts(self, field):
+        """
+        Count the entries holding each value of a metadata field, from the counts kept up to date on every change.
+
+        Arguments:
+            field (str): One of FIELDS.
+
+        Returns:
+            dict: {value: count}
+        """
+        rows = self.connection.execute("SELECT value, count FROM field_counts WHERE field = ?", (field,))
+        return {row["value"]: row["count"] for row in rows}
+
+    def date_counts(self):
+        """
+        Count the entries written on each day, from the counts kept up to date on every change.
+
+        Returns:
+            dict: {YYYY-MM-DD: count}, oldest day first.
+        """
+        rows = self.connection.execute("SELECT date, count FROM date_counts ORDER BY date")
+        return {row["date"]: row["count"] for row in rows}
+
+    def fingerprints(self):
+        """
+        Get the content fingerprint of every entry.
+
+        Returns:
+            set: The fingerprints.
+        """
+        rows = self.connection.execute("SELECT DISTINCT fingerprint FROM entries WHERE fingerprint IS NOT NULL")
+        return {row[0] for row in rows}
+
+    def duplicates(self):
+        """
+        Find the entries whose content is the same as another entry's, anywhere in the vault.
+
+        Returns:
+            list: One list per set of copies, each holding (path, title, date) tuples, oldest copy first.
+        """
+        rows = self.connection.execute(
+            "SELECT path, title, date, fingerprint FROM entries WHERE fingerprint IN ("
+            "SELECT fingerprint FROM entries WHERE fingerprint IS NOT NULL GROUP BY fingerprint HAVING COUNT(*) > 1"
+            ") ORDER BY fingerprint, created, path"
+        )
+        groups = {}
+        for row in rows:
+            groups.setdefault(row["fingerprint"], []).append((row["path"], row["title"], row["date"]))
+        return list(groups.values())
+
+    def day_index(self):
+        """
+        Get the bitmap of the days with at least one entry, building it from the per-day counts on first use.
+
+        Returns:
+            DayIndex: The day index, kept up to date by the catalog's writes.
+        """
+        if self._days is None:
+            self._days = DayIndex(self.date_counts())
+        return self._days
+
+    def sign_entries(self, tag, operator=None, percent=None):
+        """
+        Find the entries containing a dream sign, using the tag index.
+
+        Arguments:
+            tag (str): The dream sign (case-insensitive).
+            operator (str): One of >=, <=, >, <, = to compare the sign's chance with (any chance when None).
+            percent (int): The percentage to compare against.
+
+        Returns:
+            set: The matching entry ids.
+        """
+        query = "SELECT entry_id FROM tags WHERE tag = ?"
+        params = [tag]
+        if operator is not None:
+            # Chances are stored out of 10 and shown as percentages, comparing against
+            # percent / 10 keeps the (tag, percent) index usable
+            query += f" AND percent {operator} ?"
+            params.append(percent / 10)
+        return {row[0] for row in self.connection.execute(query, params)}
+
+    def sign_frequencies(self, limit=None):
+        """
+        Rank the dream signs by how often they appear, from the counts kept up to date on every change.
+
+        Arguments:
+            limit (int): How many signs to return (all when None).
+
+        Returns:
+            list: (tag, count) tuples, most frequent first.
+        """
+        query = "SELECT tag, count FROM sign_counts ORDER BY count DESC"
+        params = []
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [(row["tag"], row["count"]) for row in self.connection.execute(query, params)]
@@ -33,6 +33,15 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from utils.imports import *
 from .models.dream import Dream
 from .utils import Helpers
+from .catalog import Catalog
+from .search import SearchIndex
+from .query import EntryQuery, QueryError
+from .cache import EntryCache
+from .entries import EntryList
+from .analytics import AnalyticsEngine
+from .similar import SimilarityIndex
+from .backup import BackupSet, ArchiveIndex, BulkWriter, read_backup_entries, reverse_backup_entries, compression_of, is_archive, DEFAULT_LEVEL, FULL, INCREMENTAL, DIFFERENTIAL, TEXT
+from .sync import read_sync_entries, DedupCache, DREAM_FIELDS
 
 # Settings.json
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -49,9 +58,23 @@ JOURNAL_DIR = config['directories']['dreams']
 SYNC_FILE = config['paths']['dream-sync']
 TEXT_EDITOR = config["editor"].split()
 BACKUP_DIRECTORY = config['directories']['backups']
+SCAN_WORKERS = config.get('performance', {}).get('scan_workers', 8)
+ANALYTICS_WORKERS = config.get('performance', {}).get('analytics_workers', 0)  # 0 uses every core
+SYNC_SPEED = config.get('performance', {}).get('sync_pacing', 0)  # Seconds to pause per synced entry, just for show
+RESTORE_WORKERS = config.get('performance', {}).get('restore_workers', 8)
+BACKUP_COMPRESSION = config.get('backup', {}).get('compression', 'gzip')  # gzip, xz, bz2 or none
+BACKUP_LEVEL = config.get('backup', {}).get('level', DEFAULT_LEVEL)  # 0 (fastest) to 9 (smallest)
+BACKUP_FORMAT = config.get('backup', {}).get('format', TEXT)  # text (loads back with sync) or tar (keeps the folders)
 
 # Consts
-SYNC_SPEED = 0.05
+SYNC_PROGRESS_INTERVAL = 0.1  # Seconds between progress bar updates while syncing
+SYNC_BATCH_SIZE = 256  # Synced entries added to the catalog per transaction
+SEARCH_PAGE_SIZE = 10
+WORD_RANKING_SIZE = 20
+CACHE_ENTRIES = 256
+CACHE_BYTES = 8 * 1024 * 1024
+PREFETCH_DEPTH = 3
+SIGN_RANKING_SIZE = 10
 PROGRAM_TITLE = "Dream Journal"
 
 # Variables
@@ -62,6 +85,12 @@ logs = Logger(settings_file=settings_file_path)
 def clear():
     console.clear()
 
+def load_dream(path):
+    # Parse an entry for the cache, which also needs its size
+    with open(path, 'r') as file:
+        content = file.read()
+    return Dream.from_file(content), len(content)
+
 def get_color_for_percent(percent):
     # Convert the percent to an integer for comparison
     percent = int(percent)
@@ -77,9 +106,49 @@ def get_color_for_percent(percent):
     # Return the HEX color as a string
     return f"#{red_hex}{green_hex}00"
 
+# Colors used by the analytics tables
+DREAM_TYPE_COLORS = {
+    "Lucid": "#FFD700",
+    "Vivid": "#00FF00",
+    "Nightmare": "#FF5733",
+    "Vague": "#708090",
+    "Vivimax": "#FF69B4",
+    "No Recall": "#A9A9A9",
+    "Normal": "#FFFFFF",
+    "N/A": "#ff0000",
+    "IE": "#FF8C00",
+}
+TECHNIQUE_COLORS = {
+    "WILD": "#1E90FF",
+    "MILD": "#ff0000",
+    "SSILD": "#FF7F50",
+    "DILD": "#32CD32",
+    "N/A": "#ff0000",
+}
+SLEEP_CYCLE_COLORS = {
+    "Regular": "gray",
+    "WBTB": "#00BFFF",
+    "Nap": "#9370DB",
+    "N/A": "#ff0000",
+}
+
+def colorize(value, colors):
+    # Wrap every known word in the value with its color markup
+    for word, color in colors.items():
+        if word in value:
+            value = value.replace(word, f"[{color}]{word}[/{color}]")
+    return value
+
 class DreamHandler:
     def __init__(self):
         self.journal_dir = JOURNAL_DIR
+        self.catalog = Catalog(self.journal_dir, SCAN_WORKERS)
+        self.search_index = SearchIndex(self.catalog)
+        self.query = EntryQuery(self.catalog, self.search_index)
+        self.analytics = AnalyticsEngine(self.journal_dir, ANALYTICS_WORKERS)
+        self.backups = BackupSet(BACKUP_DIRECTORY, self.journal_dir, "Dream")
+        self.similarity = SimilarityIndex(self.catalog)
+        self.entry_cache = EntryCache(load_dream, CACHE_ENTRIES, CACHE_BYTES)
     
     # | Local Handler Functions |
     def print_panel(self, content, color, style, width):
@@ -104,6 +173,161 @@ class DreamHandler:
         unknown_command = Panel(f"[bold red]Unknown Command[/bold red]: {input_command}", expand=False)
         console.print(unknown_command)
      
+    def display_dream(self, dream_file, current_index, total_entries):
+        """
+        Display a dream entry with its index, title, date and content.
+
+        Arguments:
+            dream_file (str): The entry's path.
+            current_index (int): The entry's position, starting from 1 (None if not known yet).
+            total_entries (int): The number of entries (None if not known yet).
+
+        Returns:
+            None
+        """
+        # The listing is still loading
+        if current_index is None or total_entries is None:
+            current_index = total_entries = "..."
+
+        try:
+            dream = self.entry_cache.get(dream_file)
+
+            # Display
+
+            index_panel = Panel(
+                Text(f"[{current_index} / {total_entries}]", justify="center"),
+                title="Index",
+                border_style="white",
+                box=box.ROUNDED,
+                width=17,
+            )
+
+            # Create a table for the title and date
+            title_table = Table(border_style="white", box=box.ROUNDED, width=75)
+
+            # Add columns to the table
+            title_table.add_column("Dream Title", justify="left", width=20)
+            title_table.add_column("Dream Date", justify="left", width=10)
+
+            # Add a row with the dream title and date
+            title_table.add_row(dream.title, dream.date)
+
+            # Create a table for the stats
+            stats_table = Table(border_style="white", box=box.SQUARE, width=75)
+            stats_table.add_column("Statistics", justify="left", style="bold white", width=8)
+            stats_table.add_column("Value", justify="left", style="white", width=25)
+
+            dream_type = dream.dream_type
+            dream_type_colored = ""
+
+            if "Lucid" in dream_type:
+                dream_type_colored += f"[#FFD700]Lucid[/#FFD700] "
+            if "Vivid" in dream_type:
+                dream_type_colored += f"[#00FF00]Vivid[/#00FF00] "
+            if "Nightmare" in dream_type:
+                dream_type_colored += f"[#FF5733]Nightmare[/#FF5733] "
+            if "Vague" in dream_type:
+                dream_type_colored += f"[#708090]Vague[/#708090] "
+            if "Vivimax" in dream_type:
+                dream_type_colored += f"[#FF69B4]Vivimax[/#FF69B4] "
+            if "No Recall" in dream_type:
+                dream_type_colored += f"[#A9A9A9]No Recall[/#A9A9A9] "
+            if "Normal" in dream_type:
+                dream_type_colored += f"[#FFFFFF]Normal[/#FFFFFF] "
+            if "N/A" in dream_type:
+                dream_type_colored += f"[#ff0000]N/A[/#ff0000] "
+            if "IE" in dream_type:
+                dream_type_colored += f"[#FF8C00]IE[/#FF8C00] "
+
+            # Trim extra space at the end
+            dream_type_colored = dream_type_colored
+
+            # Color the techniques
+            technique = dream.technique
+            if "WILD" in technique:
+                technique = f"[#1E90FF]WILD[/#1E90FF]"
+            elif "MILD" in technique:
+                technique = f"[#ff0000]MILD[/#ff0000]"
+            elif "SSILD" in technique:
+                technique = f"[#FF7F50]SSILD[/#FF7F50]"
+            elif "DILD" in technique:
+                technique = f"[#32CD32]DILD[/#32CD32]"
+            elif "N/A" in technique:
+                technique = f"[#ff0000]N/A[/#ff0000]"
+
+            # Color the sleep cycles
+            sleep_cycle = dream.sleep_cycle
+            if "Regular" in sleep_cycle:
+                sleep_cycle = f"[gray]Regular[/gray]"
+            elif "WBTB" in sleep_cycle:
+                sleep_cycle = f"[#00BFFF]WBTB[/#00BFFF]"
+            elif "Nap" in sleep_cycle:
+                sleep_cycle = f"[#FFD700]Nap[/#FFD700]"
+            elif "N/A" in sleep_cycle:
+                sleep_cycle = f"[#ff0000]N/A[/#ff0000]"
+
+            # Add rows for each stat with colored values
+            stats_table.add_row("Dream Type", dream_type_colored)
+            stats_table.add_row("Technique", technique)
+            stats_table.add_row("Sleep Cycle", sleep_cycle)
+
+            console.print(stats_table)
+
+            tags_table = Table(border_style="white", box=box.SQUARE, width=75)
+            tags_table.add_column("Dream Signs", justify="left", style="bold white", width=65)
+            tags_table.add_column("Chance", justify="center", style="white", width=10)
+
+            # The dream is cached, so the tags are stripped from a copy of its text
+            entry_text = re.sub(r'\{(.*?):(\d+)\}', '', dream.entry).strip()
+
+            # Panel for the dream content
+            content_panel = Panel(
+                entry_text,
+                title="Dream Content",
+                style="white",
+                box=box.ROUNDED,
+                width=75
+            )
+
+            # Print all content before commands
+            TerminalClear.clear()
+            self.print_title()
+            console.print(index_panel)
+            console.print(title_table)
+            console.print(stats_table)
+            console.print(content_panel)
+            if dream.tags:
+                # Sort the tags based on the percentage, converting them to integers for sorting
+                sorted_tags = sorted(dream.tags, key=lambda x: int(x[1]), reverse=False)
+
+                # Add rows for each tag, now sorted by percentage
+                for tag, percent in sorted_tags:
+                    color = get_color_for_percent(percent)
+                    if percent == "0":
+                        tags_table.add_row(tag, f"[{color}]{percent}%[/{color}]")
+                    else:
+                        tags_table.add_row(tag, f"[{color}]{percent}0%[/{color}]")
+
+                console.print(tags_table)
+        except Exception as e:
+            logs.log("ERROR", f"[bold red]Error reading file: {os.path.basename(dream_file)} - {str(e)}[/bold red]")
+
+    def refresh_catalog(self):
+        """
+        Bring the catalog up to date, with a progress bar when every entry has to be read.
+
+        Returns:
+            None
+        """
+        if not self.catalog.is_empty():
+            self.catalog.refresh()
+            return
+
+        # Cold scan, there's no catalog yet (or it was from an older version)
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Indexing dreams...", total=None)
+            self.catalog.refresh(lambda checked, found: progress.update(task, completed=checked, total=found))
+
     # | Program | 
     def navigate(self):
         """
@@ -116,8 +340,16 @@ class DreamHandler:
             None
         """
         
-        # Our files
-        dream_files = Helpers.list_files(self.journal_dir)[::-1]
+        # Show the newest entry straight away, finding it only reads one year/month/day folder chain
+        newest_file = Helpers.newest_entry(self.journal_dir)
+        if newest_file:
+            self.display_dream(newest_file, None, None)
+
+        # Pick up entries that were added, edited or deleted outside of the program
+        self.refresh_catalog()
+
+        # Our files, oldest first, kept sorted as entries are created, edited and deleted
+        dream_files = EntryList(self.catalog.order_keys())
 
         # Make sure we have dream files
         if not dream_files:
@@ -129,6 +361,9 @@ class DreamHandler:
         # Store our command previously entered
         command = ""
 
+        # Which way the user is paging through the list, -1 for (n)ext and 1 for (p)rev
+        direction = -1
+
         while True:
             
             clear()
@@ -142,141 +377,18 @@ class DreamHandler:
 
             if dream_files:
                 # Display the current dream entry in a panel
-                dream_file = dream_files[index]
-
-                try:
-                    with open(dream_file, 'r') as file:
-                        dream = Dream.from_file(file.read())
-                        
-                    # Index starts from 1
-                    current_index = index + 1
-                    total_entries = len(dream_files)
-                    
-                    # Display
-
-                    index_panel = Panel(
-                        Text(f"[{current_index} / {total_entries}]", justify="center"),
-                        title="Index",
-                        border_style="white",
-                        box=box.ROUNDED,
-                        width=17,
-                    )
+                self.display_dream(dream_files[index], index + 1, len(dream_files))
 
-                    # Create a table for the title and date
-                    title_table = Table(border_style="white", box=box.ROUNDED, width=75)
-
-                    # Add columns to the table
-                    title_table.add_column("Dream Title", justify="left", width=20)
-                    title_table.add_column("Dream Date", justify="left", width=10)
-
-                    # Add a row with the dream title and date
-                    title_table.add_row(dream.title, dream.date)
-
-                    # Create a table for the stats
-                    stats_table = Table(border_style="white", box=box.SQUARE, width=75)
-                    stats_table.add_column("Statistics", justify="left", style="bold white", width=8)
-                    stats_table.add_column("Value", justify="left", style="white", width=25)
-
-                    dream_type = dream.dream_type
-                    dream_type_colored = ""
-
-                    if "Lucid" in dream_type:
-                        dream_type_colored += f"[#FFD700]Lucid[/#FFD700] "
-                    if "Vivid" in dream_type:
-                        dream_type_colored += f"[#00FF00]Vivid[/#00FF00] "
-                    if "Nightmare" in dream_type:
-                        dream_type_colored += f"[#FF5733]Nightmare[/#FF5733] "
-                    if "Vague" in dream_type:
-                        dream_type_colored += f"[#708090]Vague[/#708090] "
-                    if "Vivimax" in dream_type:
-                        dream_type_colored += f"[#FF69B4]Vivimax[/#FF69B4] "
-                    if "No Recall" in dream_type:
-                        dream_type_colored += f"[#A9A9A9]No Recall[/#A9A9A9] "
-                    if "Normal" in dream_type:
-                        dream_type_colored += f"[#FFFFFF]Normal[/#FFFFFF] "
-                    if "N/A" in dream_type:
-                        dream_type_colored += f"[#ff0000]N/A[/#ff0000] "
-                    if "IE" in dream_type:
-                        dream_type_colored += f"[#FF8C00]IE[/#FF8C00] "
-
-                    # Trim extra space at the end
-                    dream_type_colored = dream_type_colored
-
-                    # Color the techniques
-                    technique = dream.technique
-                    if "WILD" in technique:
-                        technique = f"[#1E90FF]WILD[/#1E90FF]"
-                    elif "MILD" in technique:
-                        technique = f"[#ff0000]MILD[/#ff0000]"
-                    elif "SSILD" in technique:
-                        technique = f"[#FF7F50]SSILD[/#FF7F50]"
-                    elif "DILD" in technique:
-                        technique = f"[#32CD32]DILD[/#32CD32]"
-                    elif "N/A" in technique:
-                        technique = f"[#ff0000]N/A[/#ff0000]"
-
-                    # Color the sleep cycles
-                    sleep_cycle = dream.sleep_cycle
-                    if "Regular" in sleep_cycle:
-                        sleep_cycle = f"[gray]Regular[/gray]"
-                    elif "WBTB" in sleep_cycle:
-                        sleep_cycle = f"[#00BFFF]WBTB[/#00BFFF]"
-                    elif "Nap" in sleep_cycle:
-                        sleep_cycle = f"[#FFD700]Nap[/#FFD700]"
-                    elif "N/A" in sleep_cycle:
-                        sleep_cycle = f"[#ff0000]N/A[/#ff0000]"
-
-                    # Add rows for each stat with colored values
-                    stats_table.add_row("Dream Type", dream_type_colored)
-                    stats_table.add_row("Technique", technique)
-                    stats_table.add_row("Sleep Cycle", sleep_cycle)
-
-                    console.print(stats_table)
-                    
-                    tags_table = Table(border_style="white", box=box.SQUARE, width=75)
-                    tags_table.add_column("Dream Signs", justify="left", style="bold white", width=65)
-                    tags_table.add_column("Chance", justify="center", style="white", width=10)
-
-                    dream.entry = re.sub(r'\{(.*?):(\d+)\}', '', dream.entry).strip()
-
-                    # Panel for the dream content
-                    content_panel = Panel(
-                        dream.entry,
-                        title="Dream Content",
-                        style="white",
-                        box=box.ROUNDED,
-                        width=75
-                    )
-
-                    # Print all content before commands
-                    TerminalClear.clear()
-                    self.print_title()
-                    console.print(index_panel)
-                    console.print(title_table)
-                    console.print(stats_table)
-                    console.print(content_panel)
-                    if dream.tags:
-                        # Sort the tags based on the percentage, converting them to integers for sorting
-                        sorted_tags = sorted(dream.tags, key=lambda x: int(x[1]), reverse=False)
-
-                        # Add rows for each tag, now sorted by percentage
-                        for tag, percent in sorted_tags:
-                            color = get_color_for_percent(percent)
-                            if percent == "0":
-                                tags_table.add_row(tag, f"[{color}]{percent}%[/{color}]")
-                            else:
-                                tags_table.add_row(tag, f"[{color}]{percent}0%[/{color}]")
-                        
-                        console.print(tags_table)
-                except Exception as e:
-                    logs.log("ERROR", f"[bold red]Error reading file: {os.path.basename(dream_file)} - {str(e)}[/bold red]")
+                # Read the next few entries in the paging direction (and the one behind) ahead of time
+                ahead = [dream_files[(index + direction * step) % len(dream_files)] for step in range(1, PREFETCH_DEPTH + 1)]
+                self.entry_cache.prefetch(ahead + [dream_files[(index - direction) % len(dream_files)]])
 
             # Create a horizontal table for the commands
             command_table = Table(
                 show_header=False, box=box.SQUARE, border_style="white", width=75
             )
             command_table.add_column("Command", justify="center", style="bold green")
-            command_table.add_row("(c)reate | (d)elete | (n)ext | (p)rev | (f)ind | (i)ndex | (a)nalytics | (g)raph | (b)ackup | (s)ync | (q)uit")
+            command_table.add_row("(c)reate | (d)elete | (n)ext | (p)rev | (f)ind | (i)ndex | (a)nalytics | (g)raph | (b)ackup | (r)estore | (s)ync | d(u)plicates | (q)uit")
             console.print(command_table)
             self.print_prompt(command)
 
@@ -287,26 +399,37 @@ class DreamHandler:
             # Next File
             if user_command == "n" and dream_files:
                 index -= 1
+                direction = -1
                 self.print_prompt(user_command)
                 
             # Previous File
             elif user_command == "p" and dream_files:
                 index += 1
+                direction = 1
                 self.print_prompt(user_command)
                 
             # Create File
             elif user_command == "c":
                 TerminalClear.clear()
                 self.print_title()
-                self.create_dream()
-                dream_files = Helpers.list_files(self.journal_dir)[::-1]
-                index = len(dream_files) - 1
+                new_path = self.create_dream()
+                if new_path and self.catalog.order_key(new_path):
+                    dream_files.add(*self.catalog.order_key(new_path))
+                    index = dream_files.index(new_path)
             
             # Edit File
             elif user_command == "e" and dream_files:
                 self.print_prompt(user_command)
-                self.edit_dream(dream_files[index])
-                dream_files = Helpers.list_files(self.journal_dir)[::-1]
+                edited_path = dream_files[index]
+                self.edit_dream(edited_path)
+                # A changed date moves the entry, so follow it
+                if self.catalog.order_key(edited_path):
+                    dream_files.add(*self.catalog.order_key(edited_path))
+                    index = dream_files.index(edited_path)
+                elif edited_path in dream_files:
+                    # The file was deleted in the editor
+                    dream_files.remove(edited_path)
+                    index = index - 1
                 
             # Index File
             elif user_command == "i" and dream_files:
@@ -336,8 +459,9 @@ class DreamHandler:
                 
                 # Check if the entered number matches the generated number
                 if user_input == str(random_number):
-                    self.delete_dream(dream_files[index])
-                    dream_files = Helpers.list_files(self.journal_dir)[::-1] # Re-fetch the dream files after deletion
+                    deleted_path = dream_files[index]
+                    self.delete_dream(deleted_path)
+                    dream_files.remove(deleted_path)
                     index = index - 1
             
             # Sync Files
@@ -349,195 +473,47 @@ class DreamHandler:
                 if sync_confirm == "y":
                     clear()
                     self.print_prompt(user_command)
-                    self.sync()  # Proceed with syncing
-                    dream_files = Helpers.list_files(self.journal_dir)[::-1]  # Re-fetch the dream files after syncing
+                    created_paths = self.sync()  # Proceed with syncing
+                    # Stay on the entry being viewed while the new ones are slotted in
+                    current_path = dream_files[index] if dream_files else None
+                    for path in created_paths:
+                        # Skip entries that are already gone from the catalog
+                        key = self.catalog.order_key(path)
+                        if key:
+                            dream_files.add(*key)
+                    index = dream_files.index(current_path) if current_path else len(dream_files) - 1
                 else:
                     console.print("[bold yellow]Sync canceled.[/bold yellow]")
-                dream_files = Helpers.list_files(self.journal_dir)[::-1]   
                       
+            # Remove Duplicate Files
+            elif user_command == "u" and dream_files:
+                for deleted_path in self.remove_duplicates():
+                    dream_files.remove(deleted_path)
+
             # Find Files
             elif user_command == "f" and dream_files:
                 # Prompt the user for a search keyword
-                self.print_panel("Search Keyword:", "bold white", "white", 45)
+                self.print_panel("Search (e.g. type:Lucid date:2024-01..2024-06 \"falling\" /regex/):", "bold white", "white", 75)
                 search_keyword = Prompt.ask("", show_default=False)
                 
-                # Gather a list of files that match the search phrase along with their original index
-                matching_files = []
-                '''for index, file in enumerate(Helpers.list_files(self.journal_dir)):
-                    with open(file, 'r') as f:
-                        content = f.read()
-                        # Use a regex to match whole words only (case-insensitive)
-                        if re.search(rf'\b{re.escape(search_keyword)}\b', content, flags=re.IGNORECASE):
-                            matching_files.append((file, index))'''
-                            
-                for index, file in enumerate(dream_files):
-                    with open(file, 'r') as f:
-                        content = f.read().lower()
-                        if search_keyword.lower() in content:
-                            matching_files.append((file, index)) 
-
-                # Reverse the list of matching files
-                matching_files = matching_files
+                # Rank the matching entries using the search indexes
+                try:
+                    hits = self.query.find(search_keyword)
+                except re.error:
+                    self.print_panel(f"Invalid Regex: {search_keyword}", "bold red", "red", 75)
+                    time.sleep(1)
+                    continue
+                except QueryError as e:
+                    self.print_panel(f"Invalid Query: {e}", "bold red", "red", 75)
+                    time.sleep(1)
+                    continue
                 
                 # If no matches found, log an error
-                if not matching_files:
+                if not hits:
                     self.print_panel(f"No Matches For: {search_keyword}", "bold red", "red", 75)
                     time.sleep(1)
                 else:
-                    search_index = len(matching_files) - 1
-
-                    # New search-based navigation
-                    while True:
-                        # Clear the terminal
-                        TerminalClear.clear()
-                        
-                        search_dream_file, original_index = matching_files[search_index]
-
-                        try:
-                            with open(search_dream_file, 'r') as file:
-                                dream = Dream.from_file(file.read())
-
-                            # Index starts from 1, not 0
-                            current_index = search_index + 1
-                            total_entries = len(matching_files)
-
-                            index_panel = Panel(
-                                Text(f"[{current_index} / {total_entries}] @ Index: {original_index + 1}", justify="center"),
-                                title="Search Results",
-                                border_style="white",
-                                box=box.ROUNDED,
-                                width=30,
-                            )
-
-                            # Create a table for the title and date
-                            title_table = Table(border_style="white", box=box.ROUNDED, width=75)
-
-                            # Add columns to the table
-                            title_table.add_column("Dream Title", justify="left", style="italic", width=20)
-                            title_table.add_column("Dream Date", justify="left", style="italic", width=10)
-
-                            # Create a Text object for the title
-                            highlighted_title = Text(dream.title)
-
-                            # Highlight all occurrences of the search_keyword (case-insensitive)
-                            highlighted_title.highlight_regex(
-                                rf"(?i){re.escape(search_keyword)}",  # (?i) makes it case-insensitive
-                                style="bold yellow"
-                            )
-
-                            # Add a row with the dream title and date
-                            title_table.add_row(highlighted_title, dream.date)
-
-                            # Create a table for the stats
-                            stats_table = Table(border_style="white", box=box.SQUARE, width=75)
-
-                            # Add columns to the table
-                            stats_table.add_column("Statistics", justify="left", style="bold green", width=8)
-                            stats_table.add_column("Value", justify="left", style="white", width=25)
-
-                            dream_type = dream.dream_type
-                            dream_type_colored = ""
-
-                            if "Lucid" in dream_type:
-                                dream_type_colored += f"[#FFD700]Lucid[/#FFD700] "
-                            if "Vivid" in dream_type:
-                                dream_type_colored += f"[#00FF00]Vivid[/#00FF00] "
-                            if "Nightmare" in dream_type:
-                                dream_type_colored += f"[#FF5733]Nightmare[/#FF5733] "
-                            if "Vague" in dream_type:
-                                dream_type_colored += f"[#708090]Vague[/#708090] "
-                            if "Vivimax" in dream_type:
-                                dream_type_colored += f"[#FF69B4]Vivimax[/#FF69B4] "
-                            if "No Recall" in dream_type:
-                                dream_type_colored += f"[#A9A9A9]No Recall[/#A9A9A9] "
-                            if "Normal" in dream_type:
-                                dream_type_colored += f"[#FFFFFF]Normal[/#FFFFFF] "
-                            if "N/A" in dream_type:
-                                dream_type_colored += f"[#ff0000]N/A[/#ff0000] "
-                            if "IE" in dream_type:
-                                dream_type_colored += f"[#FF8C00]IE[/#FF8C00] "
-
-                            # Trim extra space at the end
-                            dream_type_colored = dream_type_colored
-
-                            # Color the techniques
-                            technique = dream.technique
-                            if "WILD" in technique:
-                                technique = f"[#1E90FF]WILD[/#1E90FF]"
-                            elif "MILD" in technique:
-                                technique = f"[#ff0000]MILD[/#ff0000]"
-                            elif "SSILD" in technique:
-                                technique = f"[#FF7F50]SSILD[/#FF7F50]"
-                            elif "DILD" in technique:
-                                technique = f"[#32CD32]DILD[/#32CD32]"
-                            elif "N/A" in technique:
-                                technique = f"[#ff0000]N/A[/#ff0000]"
-
-                            # Color the sleep cycles
-                            sleep_cycle = dream.sleep_cycle
-                            if "Regular" in sleep_cycle:
-                                sleep_cycle = f"[gray]Regular[/gray]"
-                            elif "WBTB" in sleep_cycle:
-                                sleep_cycle = f"[#00BFFF]WBTB[/#00BFFF]"
-                            elif "Nap" in sleep_cycle:
-                                sleep_cycle = f"[#FFD700]Nap[/#FFD700]"
-                            elif "N/A" in sleep_cycle:
-                                sleep_cycle = f"[#ff0000]N/A[/#ff0000]"
-
-                            # Add rows for each stat with colored values
-                            stats_table.add_row("Dream Type", dream_type_colored)
-                            stats_table.add_row("Technique", technique)
-                            stats_table.add_row("Sleep Cycle", sleep_cycle)
-
-                            # Create a Text object for the content
-                            highlighted_entry = Text(dream.entry)
-
-                            # Highlight all occurrences of the search_keyword (case-insensitive)
-                            highlighted_entry.highlight_regex(
-                                rf"(?i){re.escape(search_keyword)}",  # (?i) makes it case-insensitive
-                                style="underline bold yellow"
-                            )
-
-                            # Panel for the dream content
-                            content_panel = Panel(
-                                highlighted_entry,
-                                title="Dream Content",
-                                border_style="white",
-                                box=box.ROUNDED,
-                                width=75
-                            )
-
-                            # Print all content before commands
-                            TerminalClear.clear()
-                            self.print_title()
-                            console.print(index_panel)
-                            console.print(title_table)
-                            console.print(stats_table)
-                            console.print(content_panel)
-
-                        except Exception as e:
-                            logs.log("ERROR", f"[bold red]Error reading file: {os.path.basename(search_dream_file)} - {str(e)}[/bold red]")
-
-                        # Create a horizontal table for the commands
-                        command_table = Table(
-                            show_header=False, box=box.SQUARE, border_style="white", width=75
-                        )
-                        command_table.add_column("Command", justify="center", style="bold green")
-
-                        # Add the commands in a horizontal format
-                        command_table.add_row("(n)ext | (p)revious | (q)uit")
-                        console.print(command_table)
-
-                        # Ask user for input
-                        user_command = Helpers.getch().lower()
-
-                        # Handle navigation commands
-                        if user_command == 'n':
-                            search_index = (search_index - 1) % len(matching_files)  # Move to the next result
-                        elif user_command == 'p':
-                            search_index = (search_index + 1) % len(matching_files)  # Move to the previous result
-                        elif user_command == 'q':
-                            break  # Exit the search navigation loop
+                    self.search_results(hits, search_keyword, dream_files)
             
             # Backup Files
             elif user_command == "b" and dream_files:
@@ -546,9 +522,19 @@ class DreamHandler:
                 backup_confirm = Prompt.ask("", show_default=False)
                 
                 if backup_confirm == "y":
-                    self.backup() 
+                    self.print_panel("Backup type: (f)ull | (i)ncremental | (d)ifferential", "bold white", "white", 75)
+                    backup_kind = {"i": INCREMENTAL, "d": DIFFERENTIAL}.get(Prompt.ask("", show_default=False).lower(), FULL)
+                    self.backup(backup_kind)
                 else:
                     console.print("[bold yellow]Sync canceled.[/bold yellow]")
+
+            # Restore Backups
+            elif user_command == "r":
+                # Stay on the entry being viewed, the list is rebuilt as a restore can add thousands
+                current_path = dream_files[index] if dream_files else None
+                if self.restore():
+                    dream_files = EntryList(self.catalog.order_keys())
+                index = dream_files.index(current_path) if current_path else len(dream_files) - 1
             
             # Show Dream Statistics
             elif user_command == "a" and dream_files:
@@ -581,6 +567,244 @@ class DreamHandler:
                 break
         pass
     
+    def search_results(self, hits, search_keyword, dream_files):
+        """
+        Show ranked search hits as a paginated table, and open any of them.
+
+        Arguments:
+            hits (list): SearchHit tuples, best match first.
+            search_keyword (str): The search, used for highlighting.
+            dream_files (EntryList): The navigator's entries, to show each hit's index.
+
+        Returns:
+            None
+        """
+        # Where each entry sits in the navigator
+        positions = {hit.path: dream_files.index(hit.path) for hit in hits if hit.path in dream_files}
+        pages = (len(hits) - 1) // SEARCH_PAGE_SIZE + 1
+        page = 0
+        # What the search matched, for the snippets
+        highlight = self.query.highlight_pattern(search_keyword)
+
+        while True:
+            page_hits = hits[page * SEARCH_PAGE_SIZE:(page + 1) * SEARCH_PAGE_SIZE]
+            snippets = self.search_index.snippets(page_hits, highlight)
+
+            TerminalClear.clear()
+            self.print_title()
+
+            results_table = Table(
+                title=f"{len(hits)} Results For: {search_keyword} (Page {page + 1} / {pages})",
+                border_style="white",
+                box=box.ROUNDED,
+                width=75,
+            )
+            results_table.add_column("#", justify="right", style="bold green", width=4)
+            results_table.add_column("Dream Title", justify="left", width=16)
+            results_table.add_column("Dream Date", justify="left", width=10)
+            results_table.add_column("Snippet", justify="left")
+
+            for number, hit in enumerate(page_hits, start=page * SEARCH_PAGE_SIZE + 1):
+                results_table.add_row(str(number), hit.title, hit.date or "", snippets[hit.entry_id])
+            console.print(results_table)
+
+            # Create a horizontal table for the commands
+            command_table = Table(
+                show_header=False, box=box.SQUARE, border_style="white", width=75
+            )
+            command_table.add_column("Command", justify="center", style="bold green")
+            command_table.add_row("(n)ext page | (p)rev page | (o)pen result | (q)uit")
+            console.print(command_table)
+
+            # Ask user for input
+            user_command = Helpers.getch().lower()
+
+            if user_command == 'n':
+                page = (page + 1) % pages
+            elif user_command == 'p':
+                page = (page - 1) % pages
+            elif user_command == 'o':
+                self.print_panel("Result Number:", "bold white", "white", 25)
+                try:
+                    result_index = int(Prompt.ask("", show_default=False)) - 1
+                    if 0 <= result_index < len(hits):
+                        self.search_result(hits, result_index, search_keyword, positions)
+                except ValueError:
+                    pass
+            elif user_command == 'q':
+                break
+
+    def search_result(self, hits, result_index, search_keyword, positions):
+        """
+        Show search hits one at a time with the search highlighted, starting at result_index.
+
+        Arguments:
+            hits (list): SearchHit tuples, best match first.
+            result_index (int): The hit to start at.
+            search_keyword (str): The search, used for highlighting.
+            positions (dict): {path: index in the navigator}
+
+        Returns:
+            None
+        """
+        # What the search matched, for highlighting
+        highlight = self.query.highlight_pattern(search_keyword)
+
+        # New search-based navigation
+        while True:
+            # Clear the terminal
+            TerminalClear.clear()
+
+            hit = hits[result_index]
+            search_dream_file = hit.path
+            original_index = positions.get(search_dream_file, 0)
+
+            try:
+                with open(search_dream_file, 'r') as file:
+                    dream = Dream.from_file(file.read())
+
+                # Index starts from 1, not 0
+                current_index = result_index + 1
+                total_entries = len(hits)
+
+                index_panel = Panel(
+                    Text(f"[{current_index} / {total_entries}] @ Index: {original_index + 1}", justify="center"),
+                    title="Search Results",
+                    border_style="white",
+                    box=box.ROUNDED,
+                    width=30,
+                )
+
+                # Create a table for the title and date
+                title_table = Table(border_style="white", box=box.ROUNDED, width=75)
+
+                # Add columns to the table
+                title_table.add_column("Dream Title", justify="left", style="italic", width=20)
+                title_table.add_column("Dream Date", justify="left", style="italic", width=10)
+
+                # Create a Text object for the title
+                highlighted_title = Text(dream.title)
+
+                # Highlight all occurrences of the search_keyword (case-insensitive)
+                highlighted_title.highlight_regex(
+                    rf"(?i){highlight}",  # (?i) makes it case-insensitive
+                    style="bold yellow"
+                )
+
+                # Add a row with the dream title and date
+                title_table.add_row(highlighted_title, dream.date)
+
+                # Create a table for the stats
+                stats_table = Table(border_style="white", box=box.SQUARE, width=75)
+
+                # Add columns to the table
+                stats_table.add_column("Statistics", justify="left", style="bold green", width=8)
+                stats_table.add_column("Value", justify="left", style="white", width=25)
+
+                dream_type = dream.dream_type
+                dream_type_colored = ""
+
+                if "Lucid" in dream_type:
+                    dream_type_colored += f"[#FFD700]Lucid[/#FFD700] "
+                if "Vivid" in dream_type:
+                    dream_type_colored += f"[#00FF00]Vivid[/#00FF00] "
+                if "Nightmare" in dream_type:
+                    dream_type_colored += f"[#FF5733]Nightmare[/#FF5733] "
+                if "Vague" in dream_type:
+                    dream_type_colored += f"[#708090]Vague[/#708090] "
+                if "Vivimax" in dream_type:
+                    dream_type_colored += f"[#FF69B4]Vivimax[/#FF69B4] "
+                if "No Recall" in dream_type:
+                    dream_type_colored += f"[#A9A9A9]No Recall[/#A9A9A9] "
+                if "Normal" in dream_type:
+                    dream_type_colored += f"[#FFFFFF]Normal[/#FFFFFF] "
+                if "N/A" in dream_type:
+                    dream_type_colored += f"[#ff0000]N/A[/#ff0000] "
+                if "IE" in dream_type:
+                    dream_type_colored += f"[#FF8C00]IE[/#FF8C00] "
+
+                # Trim extra space at the end
+                dream_type_colored = dream_type_colored
+
+                # Color the techniques
+                technique = dream.technique
+                if "WILD" in technique:
+                    technique = f"[#1E90FF]WILD[/#1E90FF]"
+                elif "MILD" in technique:
+                    technique = f"[#ff0000]MILD[/#ff0000]"
+                elif "SSILD" in technique:
+                    technique = f"[#FF7F50]SSILD[/#FF7F50]"
+                elif "DILD" in technique:
+                    technique = f"[#32CD32]DILD[/#32CD32]"
+                elif "N/A" in technique:
+                    technique = f"[#ff0000]N/A[/#ff0000]"
+
+                # Color the sleep cycles
+                sleep_cycle = dream.sleep_cycle
+                if "Regular" in sleep_cycle:
+                    sleep_cycle = f"[gray]Regular[/gray]"
+                elif "WBTB" in sleep_cycle:
+                    sleep_cycle = f"[#00BFFF]WBTB[/#00BFFF]"
+                elif "Nap" in sleep_cycle:
+                    sleep_cycle = f"[#FFD700]Nap[/#FFD700]"
+                elif "N/A" in sleep_cycle:
+                    sleep_cycle = f"[#ff0000]N/A[/#ff0000]"
+
+                # Add rows for each stat with colored values
+                stats_table.add_row("Dream Type", dream_type_colored)
+                stats_table.add_row("Technique", technique)
+                stats_table.add_row("Sleep Cycle", sleep_cycle)
+
+                # Create a Text object for the content
+                highlighted_entry = Text(dream.entry)
+
+                # Highlight all occurrences of the search_keyword (case-insensitive)
+                highlighted_entry.highlight_regex(
+                    rf"(?i){highlight}",  # (?i) makes it case-insensitive
+                    style="underline bold yellow"
+                )
+
+                # Panel for the dream content
+                content_panel = Panel(
+                    highlighted_entry,
+                    title="Dream Content",
+                    border_style="white",
+                    box=box.ROUNDED,
+                    width=75
+                )
+
+                # Print all content before commands
+                TerminalClear.clear()
+                self.print_title()
+                console.print(index_panel)
+                console.print(title_table)
+                console.print(stats_table)
+                console.print(content_panel)
+
+            except Exception as e:
+                logs.log("ERROR", f"[bold red]Error reading file: {os.path.basename(search_dream_file)} - {str(e)}[/bold red]")
+
+            # Create a horizontal table for the commands
+            command_table = Table(
+                show_header=False, box=box.SQUARE, border_style="white", width=75
+            )
+            command_table.add_column("Command", justify="center", style="bold green")
+
+            # Add the commands in a horizontal format
+            command_table.add_row("(n)ext | (p)revious | (q)uit")
+            console.print(command_table)
+
+            # Ask user for input
+            user_command = Helpers.getch().lower()
+
+            # Handle navigation commands
+            if user_command == 'n':
+                result_index = (result_index + 1) % len(hits)  # Move to the next result
+            elif user_command == 'p':
+                result_index = (result_index - 1) % len(hits)  # Move to the previous result
+            elif user_command == 'q':
+                break  # Back to the results table
+
     def edit_dream(self, path):
         """
         Edit the dream journal file using Emacs in the terminal.
@@ -593,16 +817,22 @@ class DreamHandler:
         """
         
         if os.path.exists(path):
-            # Define the command to open the file in Emacs in the terminal
-            TEXT_EDITOR.append(path)
-            
             try:
-                # Use subprocess to open the file in Emacs
-                subprocess.run(TEXT_EDITOR, check=True)
+                # Use subprocess to open the file in Emacs (a copy of the command, so paths don't pile up)
+                subprocess.run(TEXT_EDITOR + [path], check=True)
             except subprocess.CalledProcessError as e:
                 logs.log("ERROR", f"[bold red]Failed to open {path} in Emacs.[/bold red]")
+                return
             except FileNotFoundError as e:
                 logs.log("ERROR", "[bold red]Emacs is not installed or not found.[/bold red]")
+                return
+
+            self.entry_cache.invalidate(path)
+            try:
+                self.catalog.index_file(path)
+            except FileNotFoundError:
+                # Deleted or renamed from inside the editor
+                self.catalog.remove(path)
         else:
             console.print(f"[bold red]The file {path} does not exist.[/bold red]")
     
@@ -614,7 +844,7 @@ class DreamHandler:
             None
 
         Returns:
-            None
+            str: The new entry's path, or None if the creation was cancelled.
         """
 
         # Prompt the user for the date in MM/DD/YYYY format using Rich
@@ -720,10 +950,13 @@ class DreamHandler:
         new_path = os.path.join(folder_path, file_name)
         with open(new_path, 'w') as dream_file:
             dream_file.write(dream.format_dream_entry())
+        self.catalog.index_file(new_path)
             
         # Open file if 'y'
         if edit_choice.lower() == 'y':
             self.edit_dream(new_path)
+
+        return new_path
     
     def delete_dream(self, path):
         """
@@ -737,9 +970,59 @@ class DreamHandler:
         """
         if os.path.exists(path):
             os.remove(path)
+            self.catalog.remove(path)
+            self.entry_cache.invalidate(path)
             logs.log("INFO", f"[bold yellow]Deleted: {path}[/bold yellow]")
 
-    def display_counter(self, counter, title):
+    def remove_duplicates(self):
+        """
+        Find entries with the same content anywhere in the vault, and offer to delete
+        every copy but the oldest.
+
+        Returns:
+            list: The paths of the deleted entries.
+        """
+        groups = self.catalog.duplicates()
+        if not groups:
+            self.print_panel("No Duplicates Found", "bold green", "green", 75)
+            time.sleep(1)
+            return []
+
+        TerminalClear.clear()
+        self.print_title()
+        duplicates_table = Table(
+            title=f"{len(groups)} Entries With Copies",
+            border_style="white",
+            box=box.ROUNDED,
+            width=75,
+        )
+        duplicates_table.add_column("#", justify="right", style="bold white", width=4)
+        duplicates_table.add_column("Title", justify="left", width=25)
+        duplicates_table.add_column("Date", justify="left", width=12)
+        duplicates_table.add_column("Kept", justify="center", width=6)
+
+        for number, group in enumerate(groups, start=1):
+            for copy, (path, title, date) in enumerate(group):
+                duplicates_table.add_row(
+                    str(number) if copy == 0 else "", title, date or "", "[green]yes[/green]" if copy == 0 else "[red]no[/red]"
+                )
+        console.print(duplicates_table)
+
+        random_number = random.randint(1000, 9999)
+        self.print_panel(f"Enter Number To Delete The Copies: {random_number}", "bold red", "red", 75)
+        user_input = Prompt.ask("", show_default=False)
+        if user_input != str(random_number):
+            return []
+
+        deleted = []
+        for group in groups:
+            for path, _, _ in group[1:]:
+                self.delete_dream(path)
+                deleted.append(path)
+        logs.log("INFO", f"[bold yellow]Deleted {len(deleted)} Duplicate Entries[/bold yellow]")
+        return deleted
+
+    def display_counter(self, counter, title, colors=None):
         self.print_panel(f"{title}", "bold white", "white", 35)
         table = Table()
         table.add_column("Type", justify="left")
@@ -751,7 +1034,7 @@ class DreamHandler:
         # Add rows to the table, excluding any items with a '+'
         for key, value in sorted_items:
             if '+' not in key:
-                table.add_row(key, str(value))
+                table.add_row(colorize(key, colors or {}), str(value))
 
         # Display the table
         console.print(table)
@@ -764,127 +1047,120 @@ class DreamHandler:
             - Dream Types: {dream_types}
             - Techniques: {techniques}
             - Sleep Cycles: {sleep_cycles}
-        - Streak: X
+        - Current and longest streak, gaps
         '''
         exit_loop = False
 
         while not exit_loop:
             
-            dream_type_count = Counter()
-            technique_count = Counter()
-            sleep_cycle_count = Counter()
-
-            dream_dates = []  # List to store the dates of the dream entries
-            dream_files = Helpers.list_files(self.journal_dir)
-
-            if not dream_files:
+            # The catalog keeps these counts up to date, so nothing is re-read here
+            if self.catalog.is_empty():
                 console.print(f"[yellow]No Dream Entries Found[/yellow]\n")
                 return  # Early exit since there are no entries to process
 
-            for file_path in dream_files:
-                with open(file_path, 'r') as file:
-                    lines = file.readlines()
-
-                    for i, line in enumerate(lines):
-                        # Color the dream types
-                        if i == 2 and "Lucid" in line:
-                            line = line.replace("Lucid", f"[#FFD700]Lucid[/#FFD700]")
-                        if i == 2 and "Vivid" in line:
-                            line = line.replace("Vivid", f"[#00FF00]Vivid[/#00FF00]")
-                        if i == 2 and "Nightmare" in line:
-                            line = line.replace("Nightmare", f"[#FF5733]Nightmare[/#FF5733]")
-                        if i == 2 and "Vague" in line:
-                            line = line.replace("Vague", f"[#708090]Vague[/#708090]")
-                        if i == 2 and "Vivimax" in line:
-                            line = line.replace("Vivimax", f"[#FF69B4]Vivimax[/#FF69B4]")
-                        if i == 2 and "No Recall" in line:
-                            line = line.replace("No Recall", f"[#A9A9A9]No Recall[/#A9A9A9]")
-                        if i == 2 and "Normal" in line:
-                            line = line.replace("Normal", f"[#FFFFFF]Normal[/#FFFFFF]")
-                        if i == 2 and "N/A" in line:
-                            line = line.replace("N/A", f"[#ff0000]N/A[/#ff0000]")
-                        if i == 2 and "IE" in line:
-                            line = line.replace("IE", f"[#FF8C00]IE[/#FF8C00]")
-
-                        # Color the dream techniques
-                        if i == 3 and "WILD" in line:
-                            line = line.replace("WILD", f"[#1E90FF]WILD[/#1E90FF]")
-                        if i == 3 and "MILD" in line:
-                            line = line.replace("MILD", f"[#ff0000]MILD[/#ff0000]")
-                        if i == 3 and "SSILD" in line:
-                            line = line.replace("SSILD", f"[#FF7F50]SSILD[/#FF7F50]")
-                        if i == 3 and "DILD" in line:
-                            line = line.replace("DILD", f"[#32CD32]DILD[/#32CD32]")
-                        if i == 3 and "N/A" in line:
-                            line = line.replace("N/A", f"[#ff0000]N/A[/#ff0000]")
-
-                        # Color the sleep cycles
-                        if i == 4 and "Regular" in line:
-                            line = line.replace("Regular", f"[gray]Regular[/gray]")
-                        if i == 4 and "WBTB" in line:
-                            line = line.replace("WBTB", f"[#00BFFF]WBTB[/#00BFFF]")
-                        if i == 4 and "Nap" in line:
-                            line = line.replace("Nap", f"[#9370DB]Nap[/#9370DB]")
-                        if i == 4 and "N/A" in line:
-                            line = line.replace("N/A", f"[#ff0000]N/A[/#ff0000]")
-
-                        # Update counters
-                        if i == 2:
-                            dream_types = line.split("Dream Type:")[1].strip().split(", ")
-                            dream_type_count.update(dream_types)
-                        elif i == 3:
-                            techniques = line.split("Technique:")[1].strip().split(", ")
-                            technique_count.update(techniques)
-                        elif i == 4:
-                            sleep_cycles = line.split("Sleep Cycle:")[1].strip().split(", ")
-                            sleep_cycle_count.update(sleep_cycles)
-
-                        # Store the date of the dream entry (assuming the date is on line 1)
-                        if i == 0:
-                            # Extract the date using Helpers.extract_date_from_file
-                            date_str = line.split("|")[1].strip().replace("(", "").replace(")", "").replace(" ]", "")
-                            try:
-                                # Parse the date format (e.g., 19 January, 2025)
-                                dream_dates.append(datetime.strptime(date_str, '%d %B, %Y'))
-                            except ValueError:
-                                pass  # If the date format is not valid, skip this entry
-
-            max_streak = 0
-            
-            # Calculate the streak
-            if dream_dates:
-                dream_dates.sort()
-                streak = 1
-                max_streak = 1
-
-                for i in range(1, len(dream_dates)):
-                    # Check if the date is the previous day (streak continuation)
-                    if (dream_dates[i] - dream_dates[i-1]).days == 1:
-                        streak += 1
-                    else:
-                        streak = 1
-                    max_streak = max(max_streak, streak)
+            dream_type_count = self.catalog.field_counts("dream_type")
+            technique_count = self.catalog.field_counts("technique")
+            sleep_cycle_count = self.catalog.field_counts("sleep_cycle")
 
-            # Prepare statistics output
-            num_dream_journals = len(dream_files)
+            # Streaks come from the catalog's bitmap of days with an entry
+            streaks = self.catalog.day_index().stats()
 
             clear()
             self.print_panel(f"Analytics", "bold green", "green", 13)
-            self.print_panel(f"[bold #FFD700]Streak[/bold #FFD700]: {max_streak}", "bold white", "white", 15)
-            self.display_counter(dream_type_count, "Dream Type Counts")
-            self.display_counter(technique_count, "Technique Counts")
-            self.display_counter(sleep_cycle_count, "Sleep Cycle Counts")
+            self.print_panel(
+                f"[bold #FFD700]Current Streak[/bold #FFD700]: {streaks.current}  "
+                f"[bold #FFD700]Longest Streak[/bold #FFD700]: {streaks.longest}\n"
+                f"[bold #FFD700]Days Written[/bold #FFD700]: {streaks.days}  "
+                f"[bold #FFD700]Gaps[/bold #FFD700]: {streaks.gaps}  "
+                f"[bold #FFD700]Longest Gap[/bold #FFD700]: {streaks.longest_gap}",
+                "bold white", "white", 60
+            )
+            self.display_counter(dream_type_count, "Dream Type Counts", DREAM_TYPE_COLORS)
+            self.display_counter(technique_count, "Technique Counts", TECHNIQUE_COLORS)
+            self.display_counter(sleep_cycle_count, "Sleep Cycle Counts", SLEEP_CYCLE_COLORS)
+            self.display_counter(dict(self.catalog.sign_frequencies(SIGN_RANKING_SIZE)), "Dream Sign Counts")
             
             command_table = Table(
-                show_header=False, box=box.SQUARE, border_style="white", width=10
+                show_header=False, box=box.SQUARE, border_style="white", width=56
             )
             command_table.add_column("Command", justify="center", style="bold green")
-            command_table.add_row("(q)uit")
+            command_table.add_row("(w)ords | (p)airs | (s)imilar | (r)eindex | (q)uit")
             console.print(command_table)
             user_command = Helpers.getch().lower()
 
             if user_command == "q":
                 break
+            elif user_command == "w":
+                with console.status("[cyan]Counting words..."):
+                    words = self.analytics.word_frequencies(WORD_RANKING_SIZE)
+                self.show_ranking(dict(words), "Word Counts")
+            elif user_command == "p":
+                with console.status("[cyan]Counting dream sign pairs..."):
+                    pairs = self.analytics.sign_pairs(SIGN_RANKING_SIZE)
+                self.show_ranking({f"{first} & {second}": count for (first, second), count in pairs}, "Dream Sign Pairs")
+            elif user_command == "s":
+                with console.status("[cyan]Looking for similar entries..."):
+                    clusters = self.similarity.clusters()
+                self.show_similar(clusters)
+            elif user_command == "r":
+                # Rebuild the catalog from scratch, one process per year
+                with console.status("[cyan]Reindexing dreams..."):
+                    indexed = self.analytics.reindex(self.catalog)
+                self.print_panel(f"Reindexed {indexed} Entries", "bold green", "green", 35)
+                time.sleep(1)
+
+    def show_similar(self, clusters):
+        """
+        Show the groups of entries that read almost the same until a key is pressed.
+
+        Arguments:
+            clusters (list): Lists of SimilarEntry tuples, from SimilarityIndex.clusters().
+
+        Returns:
+            None
+        """
+        clear()
+        self.print_panel("Analytics", "bold green", "green", 13)
+        if not clusters:
+            self.print_panel("No Similar Entries Found", "bold green", "green", 35)
+        else:
+            similar_table = Table(
+                title=f"{len(clusters)} Groups Of Similar Entries",
+                border_style="white",
+                box=box.ROUNDED,
+                width=75,
+            )
+            similar_table.add_column("#", justify="right", style="bold white", width=4)
+            similar_table.add_column("Title", justify="left", width=30)
+            similar_table.add_column("Date", justify="left", width=12)
+            similar_table.add_column("Similarity", justify="right", width=10)
+
+            for number, cluster in enumerate(clusters, start=1):
+                for position, entry in enumerate(cluster):
+                    similar_table.add_row(
+                        str(number) if position == 0 else "", entry.title, entry.date or "",
+                        "" if position == 0 else f"{entry.similarity:.0%}"
+                    )
+            console.print(similar_table)
+        self.print_panel("Press any key to go back", "bold white", "white", 30)
+        Helpers.getch()
+
+    def show_ranking(self, counter, title):
+        """
+        Show a ranking from the analytics engine until a key is pressed.
+
+        Arguments:
+            counter (dict): {name: count}
+            title (str): The ranking's title.
+
+        Returns:
+            None
+        """
+        clear()
+        self.print_panel("Analytics", "bold green", "green", 13)
+        self.display_counter(counter, title)
+        self.print_panel("Press any key to go back", "bold white", "white", 30)
+        Helpers.getch()
 
     def lucid_graph(self, start_month, start_year, end_month, end_year, graph_type="bar"):
         '''
@@ -902,40 +1178,22 @@ class DreamHandler:
         else:
             end_date = datetime(end_year, end_month + 1, 1) - timedelta(days=1)
 
-        # Get the list of dream files
-        dream_files = Helpers.list_files(self.journal_dir)
-
-        if not dream_files:
+        if self.catalog.is_empty():
             console.print(f"[yellow]No Dream Entries Found[/yellow]\n")
             return  # Early exit if no dream entries
 
-        # Iterate over the dream files to extract dream types and their corresponding dates
-        for file_path in dream_files:
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-
-                for i, line in enumerate(lines):
-                    # Extract the dream type and date
-                    if i == 2:
-                        dream_type = None
-                        if "Lucid" in line:
-                            dream_type = "Lucid"
-                        elif "Vivid" in line:
-                            dream_type = "Vivid"
-                        elif "Vivimax" in line:
-                            dream_type = "Vivimax"
-
-                        if dream_type:
-                            # Extract date from the first line (assuming date is on line 1)
-                            date_str = lines[0].split("|")[1].strip().replace("(", "").replace(")", "").replace(" ]", "")
-                            try:
-                                # Parse the date format (e.g., 19 January, 2025)
-                                dream_date = datetime.strptime(date_str, '%d %B, %Y')
-                                if start_date <= dream_date <= end_date:
-                                    day_str = dream_date.strftime('%Y-%m-%d')  # Use string date for dictionary keys
-                                    dream_data[day_str][dream_type] += 1
-                            except ValueError:
-                                pass  # Skip if date format is invalid
+        # Go over the catalogued entries in the range to count their dream types
+        for record in self.catalog.records(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')):
+            dream_type = None
+            if "Lucid" in record["dream_type"]:
+                dream_type = "Lucid"
+            elif "Vivid" in record["dream_type"]:
+                dream_type = "Vivid"
+            elif "Vivimax" in record["dream_type"]:
+                dream_type = "Vivimax"
+
+            if dream_type:
+                dream_data[record["date"]][dream_type] += 1
 
         # Prepare the data for plotting
         days = sorted(dream_data.keys())  # Sorted list of days
@@ -1004,30 +1262,13 @@ class DreamHandler:
         else:
             end_date = datetime(end_year, end_month + 1, 1) - timedelta(days=1)
 
-        # Get the list of dream files
-        dream_files = Helpers.list_files(self.journal_dir)
-
-        if not dream_files:
+        if self.catalog.is_empty():
             console.print(f"[yellow]No Dream Entries Found[/yellow]\n")
             return  # Early exit if no dream entries
 
-        # Iterate over the dream files to count the number of entries per day
-        for file_path in dream_files:
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
-
-                for i, line in enumerate(lines):
-                    # Extract date from the first line (assuming date is on line 1)
-                    if i == 0:
-                        date_str = lines[0].split("|")[1].strip().replace("(", "").replace(")", "").replace(" ]", "")
-                        try:
-                            # Parse the date format (e.g., 19 January, 2025)
-                            dream_date = datetime.strptime(date_str, '%d %B, %Y')
-                            if start_date <= dream_date <= end_date:
-                                day_str = dream_date.strftime('%Y-%m-%d')  # Use string date for dictionary keys
-                                dream_entries[day_str] += 1
-                        except ValueError:
-                            pass  # Skip if date format is invalid
+        # Count the number of catalogued entries per day in the range
+        for record in self.catalog.records(start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')):
+            dream_entries[record["date"]] += 1
 
         # Prepare the list of all days within the specified range
         all_days = []
@@ -1111,155 +1352,148 @@ class DreamHandler:
         plt.tight_layout()
         plt.show()
    
-    def sync(self):
+    def sync_file(self, entry, created=None):
+        """
+        Turn a synced entry into the file it is saved as.
+
+        Arguments:
+            entry (dict): The entry's Date, Title, Body and fields, see parse_sync_entry().
+            created (datetime): When the entry counts as created, now when None.
+
+        Returns:
+            tuple: (folder path, file name, file content, dedup key)
+        """
+        entry["Body"] = entry["Body"].replace(
+            "[ Dream Entry ]",
+            "[ Dream Entry ]\n───────────────────────────────────────────────────────────────────────"
+        )
+
+        # We'll split our date, to check if it is valid
+        year, month, day = Helpers.date_formatter(entry['Date'], False, False).split('-')
+
+        date_str = f"{day}-{month}-{year}"  # "17-01-2024"
+
+        date_obj = datetime.strptime(date_str, "%d-%m-%Y")
+
+        month_name = date_obj.strftime("%B")
+
+        # Generate timestamp for the file
+        created = created or datetime.now()
+        time_stamp = created.strftime("%Y%m%d_%H%M%S_%f")
+
+        # Create a file name based on the title and timestamp
+        file_name = f"{(entry['Title']).replace(' ', '_')}_{time_stamp}.txt"
+
+        # Create a new Dream object
+        dream = Dream(
+            title=(entry["Title"]),
+            dream_type=(entry["Dream Type"]),
+            technique=(entry["Technique"]), 
+            sleep_cycle=(entry["Sleep Cycle"]),
+            entry=(entry["Body"]),  # Static for now, can be updated
+            date=f"{day} {month_name}, {year}",  # Format date as "Month Day, Year"
+            date_created=created.strftime("%Y-%m-%d %H:%M:%S")
+        )
+
+        # Define the folder structure: year/month_name/day
+        folder_path = os.path.join(self.journal_dir, str(year), month_name, str(day))
+
+        dream_content = dream.format_dream_entry()
+        key = DedupCache.key(date_obj.strftime("%Y-%m-%d"), entry['Title'])
+
+        return folder_path, file_name, dream_content, key
+
+    def sync(self, file_path=SYNC_FILE):
         """
         Sync loads a .txt file and reads all the contents. It then
         turns the text inside the body into a dream journal.
+
+        Arguments:
+            file_path (str): The sync file, or a (compressed) backup to restore.
+
+        Returns:
+            list: The paths of the entries that were created.
         """
 
-        # A count to store how many files we've created
-        files_created_count = 0
+        # The files we've created
+        created_paths = []
+        # Written but not in the catalog yet, they are added in batches
+        unindexed_paths = []
 
-        try:
-            # Open our sync.txt and read its contents
-            with open(SYNC_FILE, 'r') as file:
-                content = file.readlines()
-
-            # Variable to store all entries in an organized manner
-            organized_entries = []
-
-            # Temporary variable to store the local entry
-            entry = None
-            capture_body = False
-
-            for line in content:
-                # Remove leading and trailing spaces
-                line = line.strip()
-
-                # Check if the line starts with our delimiter
-                if line == "==============================":
-                    # Check if an entry exists and append it to organized_entries
-                    if entry and entry["Body"]:
-                        organized_entries.append(entry)
-                    # Initialize a new entry
-                    entry = {"Date": "", "Title": "", "Body": "", "Dream Type": "", "Technique": "", "Sleep Cycle": ""}
-                    capture_body = False
-
-                # If we have an entry
-                elif entry is not None:
-                    if line.startswith("[ (") and "|" in line:
-                        # Extract title and date
-                        parts = line.split("|")
-                        entry["Title"] = parts[0].strip("[ (")[:-1].strip()
-                        entry["Date"] = parts[1].strip(") ]")[1:].strip()
-                    elif line.startswith("Dream Type:"):
-                        entry["Dream Type"] = line.split(":")[1].strip()
-                    elif line.startswith("Technique:"):
-                        entry["Technique"] = line.split(":")[1].strip()
-                    elif line.startswith("Sleep Cycle:"):
-                        entry["Sleep Cycle"] = line.split(":")[1].strip()
-                    elif line.startswith("───────────────────────────────────────────────────────────────────────"):
-                        # Don't capture the separator line itself, but keep the capture process going
-                        continue
-                    elif capture_body:
-                        if entry["Body"]:
-                            entry["Body"] += "\n"
-                        entry["Body"] += line
-
-                    # Start capturing body after separator
-                    elif line.strip() and capture_body is False:
-                        capture_body = True
-                        entry["Body"] = line  # Start adding the body with the first non-separator line
-
-            # If we have a valid entry at the end of the file, append it to organized_entries
-            if entry and entry["Body"]:
-                organized_entries.append(entry)
-                
-            # The fix to the reverse order bug :D
-            organized_entries.reverse()
+        # Every entry already in the vault, so duplicates are found without listing folders
+        existing = DedupCache(self.catalog.list_paths(), self.catalog.fingerprints())
+
+        started = time.monotonic()
+        last_update = started
+        processed = 0
+
+        # Compressed files can't be read backwards, they are decompressed to a temporary file first
+        if compression_of(file_path):
+            entries = reverse_backup_entries(file_path, DREAM_FIELDS)
+        else:
+            entries = read_sync_entries(file_path, DREAM_FIELDS)
 
-            # Set up the loading bar using Rich
+        try:
+            # Set up the loading bar using Rich, it follows how much of the sync file was read
             with Progress() as progress:
-                task = progress.add_task("[cyan]Syncing dreams...", total=len(organized_entries))
+                task = progress.add_task("[cyan]Syncing dreams...", total=os.path.getsize(file_path))
 
                 count = 0
 
                 # Loop through the entries, and create a journal .txt for each
-                for entry in organized_entries:
-                    time.sleep(SYNC_SPEED) 
+                # Entries are streamed from the end, so the oldest is created first
+                for entry, read in entries:
+                    if SYNC_SPEED:
+                        time.sleep(SYNC_SPEED)
+                    processed += 1
                     try:
-                        entry["Body"] = entry["Body"].replace(
-                            "[ Dream Entry ]",
-                            "[ Dream Entry ]\n───────────────────────────────────────────────────────────────────────"
-                        )
-                        
-                        # We'll split our date, to check if it is valid
-                        year, month, day = Helpers.date_formatter(entry['Date'], False, False).split('-')
-                        
-                        date_str = f"{day}-{month}-{year}"  # "17-01-2024"
-
-                        date_obj = datetime.strptime(date_str, "%d-%m-%Y")
-                        
-                        month_name = date_obj.strftime("%B")
-                        
-                        # Generate timestamp for the file
-                        time_stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                        
-                        # Create a file name based on the title and timestamp
-                        file_name = f"{(entry['Title']).replace(' ', '_')}_{time_stamp}.txt"
-                        
-                        # Create a new Dream object
-                        dream = Dream(
-                            title=(entry["Title"]),
-                            dream_type=(entry["Dream Type"]),
-                            technique=(entry["Technique"]), 
-                            sleep_cycle=(entry["Sleep Cycle"]),
-                            entry=(entry["Body"]),  # Static for now, can be updated
-                            date=f"{day} {month_name}, {year}",  # Format date as "Month Day, Year"
-                            date_created=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        )
-
-                        # Define the folder structure: year/month_name/day
-                        folder_path = os.path.join(self.journal_dir, str(year), month_name, str(day))
-                        
+                        folder_path, file_name, dream_content, key = self.sync_file(entry)
+
+                        # Skip entries that are already in the vault, by date and title (whatever their
+                        # timestamp) or by content (whatever their title and date)
+                        if existing.seen(key, dream_content):
+                            continue
+                        existing.add(key, dream_content)
+
                         # Create the directories if they don't exist
                         if not os.path.exists(folder_path):
                             os.makedirs(folder_path)
 
-                        # For every file in the folder, remove their timestamp part and check
-                        existing_files = os.listdir(folder_path)
-
-                        # This handles the dream sync sort logic somehow :p
-                        existing_file_base_names = [
-                            file[:-27] if len(file) > 27 and file.endswith('.txt') else file
-                            for file in existing_files
-                        ]
-
-                        # Check if the file name without the timestamp already exists
-                        file_name_without_timestamp = (entry['Title']).replace(' ', '_')
-
-                        existing_file_base_names.reverse()
-
-                        if file_name_without_timestamp in existing_file_base_names:
-                            continue
-                        
                         # Write the formatted dream entry to the file
-                        with open(os.path.join(folder_path, file_name), 'w') as dream_file:
-                            dream_file.write(dream.format_dream_entry())
-                        
-                        files_created_count += 1
+                        new_path = os.path.join(folder_path, file_name)
+                        with open(new_path, 'w') as dream_file:
+                            dream_file.write(dream_content)
+                        created_paths.append(new_path)
+                        unindexed_paths.append(new_path)
+                        if len(unindexed_paths) >= SYNC_BATCH_SIZE:
+                            self.catalog.index_files(unindexed_paths)
+                            unindexed_paths = []
 
                     except Exception as e:
                         logs.log("ERROR", f"Failed to sync dreams: {e}")
                     
-                    # Update the progress bar
-                    progress.update(task, advance=1)
+                    # Update the progress bar, only every so often so it doesn't slow the sync down
+                    now = time.monotonic()
+                    if now - last_update >= SYNC_PROGRESS_INTERVAL:
+                        progress.update(task, completed=read)
+                        last_update = now
+
+                progress.update(task, completed=os.path.getsize(file_path))
 
         except Exception as e:
             logs.log("ERROR", f"[bold red]Failed to sync dreams[/bold red]: {e}")
 
+        # Whatever is left of the last batch
+        if unindexed_paths:
+            self.catalog.index_files(unindexed_paths)
+
+        elapsed = time.monotonic() - started
+        rate = processed / elapsed if elapsed > 0 else 0
+
         # Log the total files created
-        logs.log("SUCCESS", f"[bold green]'sync-dream.txt' Was Loaded! Files Created [/bold green]: {files_created_count}")
+        logs.log("SUCCESS", f"[bold green]'{os.path.basename(file_path)}' Was Loaded! Files Created [/bold green]: {len(created_paths)} ({processed} entries in {elapsed:.1f}s, {rate:.0f} entries/s)")
+
+        return created_paths
     
     def send_email(self, file_path):
         '''
@@ -1300,50 +1534,139 @@ class DreamHandler:
         except Exception as e:
             logs.log("ERROR", f"[red]Failed to send email[/red]: {e}")
 
-    def backup(self):
+    def backup(self, kind=FULL):
         '''
         Backs up the dream journal files and sends the backup via email.
-        '''
 
-        # Let us get all the dream files
-        dream_files = Helpers.list_files(self.journal_dir)
+        Arguments:
+            kind (str): FULL, INCREMENTAL (changes since the last backup) or
+                        DIFFERENTIAL (changes since the last full backup).
+        '''
 
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        backup_file_name = f"[{timestamp}]_Dream_Backup.txt"
-        output_file_path = os.path.join(BACKUP_DIRECTORY, backup_file_name)
+        # One pass over the catalogued entries into a single buffered file, compressed as it is written
+        output_file_path, kind, stats = self.backups.create(
+            self.catalog.list_paths(), kind, BACKUP_COMPRESSION, BACKUP_LEVEL, BACKUP_FORMAT
+        )
 
-        with open(output_file_path, 'w') as output_file:  # Use 'w' to overwrite the file initially
-            output_file.write("==============================\n")
+        # Nothing new since the backup this one builds on
+        if output_file_path is None:
+            logs.log("WARNING", f"\n[bold yellow]No Dream Entries Changed Since The Last Backup[/bold yellow]\n")
+            return
 
         # Checking if we have any dreams
-        if not dream_files:
+        if not stats.entries:
             logs.log("WARNING", f"\n[bold yellow]No Dream Entries Found To Backup[/bold yellow]\n")
-        else:
-            for file_path in dream_files:
-                with open(file_path, 'r') as file:
-                    lines = file.readlines()
-                    for i, line in enumerate(lines):
-                        if line.startswith("[ ("):
-                            match = re.search(r'\[ \((.*?)\) \| \((.*?)\) \]', line)
-                            if match:
-                                title = match.group(1)
-                                date_str = match.group(2)
-                                formatted_output = f"[ ({title}) | ({date_str}) ]\n"
-
-                                # Join all lines except the last one in rest_of_content
-                                rest_of_content = ''.join(lines[i + 1:])
-
-                                full_output = formatted_output + rest_of_content
-                                
-                                full_output = re.sub(r"──────────────────────────────────────────────────────────────────────{35}", 
-                                "───────────────────────────────────────────────────────────────────────", full_output)
-
-                                with open(output_file_path, 'a') as output_file:
-                                    output_file.write(full_output)
-                                    output_file.write("\n\n==============================\n")
 
+        backup_file_name = os.path.basename(output_file_path)
         self.send_email(output_file_path)
-        logs.log("STATUS", f"[bold green]Backup Success [/bold green]: {backup_file_name}")
+        rate = stats.bytes / stats.seconds / (1024 * 1024) if stats.seconds > 0 else 0
+        ratio = stats.bytes / stats.compressed_bytes if stats.compressed_bytes else 0
+        logs.log("STATUS", f"[bold green]Backup Success [/bold green]: {backup_file_name} ({kind}, {stats.entries} entries, {stats.bytes / (1024 * 1024):.1f} MB -> {stats.compressed_bytes / (1024 * 1024):.1f} MB, {ratio:.1f}x in {stats.seconds:.1f}s, {rate:.1f} MB/s)")
+
+    def restore(self):
+        """
+        Restore the newest backup: its full backup plus every incremental or differential
+        backup taken since. Tar backups are extracted under their original paths (all of
+        them, a folder or a single entry), text backups are loaded like a sync file.
+
+        Returns:
+            list: The paths of the entries that were created.
+        """
+        try:
+            chain = self.backups.chain()
+        except (OSError, ValueError) as e:
+            logs.log("ERROR", f"[bold red]Failed to restore dreams[/bold red]: {e}")
+            return []
+
+        if not chain:
+            logs.log("WARNING", f"\n[bold yellow]No Dream Backups Found To Restore[/bold yellow]\n")
+            return []
+
+        self.print_panel(f"Restore {os.path.basename(chain[-1])} ({len(chain)} backups)? (y/n):", "bold white", "white", 75)
+        if Prompt.ask("", show_default=False) != "y":
+            console.print("[bold yellow]Restore canceled.[/bold yellow]")
+            return []
+
+        # Only tar backups know where their entries go, so only they can restore part of the vault
+        selection = None
+        if all(is_archive(backup_path) for backup_path in chain):
+            self.print_panel("Restore what? (e.g. 2024/March, an entry's path, or blank for everything):", "bold white", "white", 75)
+            selection = Prompt.ask("", show_default=False).strip() or None
+
+        # Newest backup first: entries that are already in the vault (or were already
+        # restored) are skipped, so the latest version of an edited entry is the one kept
+        vault_paths = self.catalog.list_paths()
+        existing = DedupCache(vault_paths, self.catalog.fingerprints())
+        started = time.monotonic()
+        created = datetime.now()
+        with BulkWriter(RESTORE_WORKERS) as writer:
+            for backup_path in reversed(chain):
+                try:
+                    if is_archive(backup_path):
+                        ArchiveIndex(backup_path).extract(self.journal_dir, selection, writer=writer)
+                    else:
+                        created = self.restore_text(backup_path, existing, writer, created)
+                except (OSError, ValueError, KeyError) as e:
+                    logs.log("ERROR", f"[bold red]Failed to restore {os.path.basename(backup_path)}[/bold red]: {e}")
+
+        if len(writer.written) > len(vault_paths):
+            # Mostly new files: one parallel pass over the vault beats adding them one by one
+            with console.status("[cyan]Rebuilding the catalog..."):
+                self.analytics.reindex(self.catalog)
+            self.entry_cache.clear()
+        elif writer.written:
+            self.catalog.index_files(writer.written)
+        if writer.failed:
+            logs.log("ERROR", f"[bold red]Failed to write {writer.failed} restored dreams[/bold red]")
+
+        elapsed = time.monotonic() - started
+        rate = len(writer.written) / elapsed if elapsed > 0 else 0
+        logs.log("SUCCESS", f"[bold green]Restored {os.path.basename(chain[-1])}! Files Created [/bold green]: {len(writer.written)} ({elapsed:.1f}s, {rate:.0f} entries/s)")
+        return writer.written
+
+    def restore_text(self, backup_path, existing, writer, created):
+        """
+        Queue the entries of a text backup (or sync file) to be written, skipping
+        duplicates the same way sync does.
+
+        Backups list their entries newest first and are restored newest first, so each
+        entry is stamped a microsecond before the one read before it. That way the
+        entries are created oldest first, whatever order the writers finish in.
+
+        Arguments:
+            backup_path (str): The backup, compressed or not.
+            existing (DedupCache): What is already in the vault or was already restored.
+            writer (BulkWriter): Where the files are queued.
+            created (datetime): The creation time of the entry restored before this backup.
+
+        Returns:
+            datetime: The creation time of this backup's last entry, for the next (older) backup.
+        """
+        with Progress() as progress:
+            task = progress.add_task("[cyan]Restoring dreams...", total=os.path.getsize(backup_path))
+            last_update = time.monotonic()
+
+            for entry, read in read_backup_entries(backup_path, DREAM_FIELDS):
+                created -= timedelta(microseconds=1)
+                try:
+                    folder_path, file_name, dream_content, key = self.sync_file(entry, created)
+                except Exception as e:
+                    logs.log("ERROR", f"Failed to restore dreams: {e}")
+                    continue
+
+                if existing.seen(key, dream_content):
+                    continue
+                existing.add(key, dream_content)
+                writer.add(os.path.join(folder_path, file_name), dream_content)
+
+                now = time.monotonic()
+                if now - last_update >= SYNC_PROGRESS_INTERVAL:
+                    progress.update(task, completed=read)
+                    last_update = now
+
+            progress.update(task, completed=os.path.getsize(backup_path))
+
+        return created
     
     def run(self):
         """Main loop for the Dream journal."""
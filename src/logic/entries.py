@@ -0,0 +1,80 @@
+# Entries class
+# The navigator's list of entries, kept sorted so single changes don't need a full re-list
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+from bisect import bisect_left, insort
+
+def order_key(path, date, created):
+    # Same order as the catalog's listing, entries without a date come first
+    return (date or "", created or 0, path)
+
+class EntryList:
+    def __init__(self, rows=()):
+        """
+        A sorted list of entry paths, oldest first.
+
+        Arguments:
+            rows (iterable): (path, date, created) tuples, as given by Catalog.order_keys().
+        """
+        self.keys = sorted(order_key(*row) for row in rows)
+        self.key_of = {key[2]: key for key in self.keys}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, index):
+        return self.keys[index][2]
+
+    def __iter__(self):
+        return (key[2] for key in self.keys)
+
+    def __contains__(self, path):
+        return path in self.key_of
+
+    def index(self, path):
+        """
+        Find an entry's position with a binary search.
+
+        Arguments:
+            path (str): The entry's path.
+
+        Returns:
+            int: The entry's position.
+
+        Raises:
+            ValueError: If the entry is not in the list.
+        """
+        if path not in self.key_of:
+            raise ValueError(f"{path} is not in the list")
+        return bisect_left(self.keys, self.key_of[path])
+
+    def add(self, path, date, created):
+        """
+        Insert an entry at its sorted position, or move it there if it is already listed.
+        Finding the position is an O(log n) binary search, but insort still shifts the
+        entries after it, so the insert itself is O(n) (a memmove, cheap next to a re-list).
+
+        Arguments:
+            path (str): The entry's path.
+            date (str): The entry's date (YYYY-MM-DD).
+            created (int): The entry's creation timestamp.
+        """
+        if path in self.key_of:
+            self.remove(path)
+        key = order_key(path, date, created)
+        insort(self.keys, key)
+        self.key_of[path] = key
+
+    def remove(self, path):
+        """
+        Drop an entry from the list, if it is there. Like add(), the search is O(log n)
+        and the delete O(n).
+
+        Arguments:
+            path (str): The entry's path.
+        """
+        key = self.key_of.pop(path, None)
+        if key is not None:
+            del self.keys[bisect_left(self.keys, key)]
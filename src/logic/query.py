@@ -0,0 +1,257 @@
+# Query class
+# Filters entries with queries like: type:Lucid technique:WILD date:2024-01..2024-06 sign:Flying>50 "falling"
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import re
+from collections import namedtuple
+from datetime import date as calendar_date
+
+# Classes
+from .search import SearchHit, chunked
+
+# Query field -> catalog field
+FIELD_NAMES = {
+    "type": "dream_type",
+    "technique": "technique",
+    "cycle": "sleep_cycle",
+}
+
+# field:value, field:"some value", "exact text", /regex/ or a plain word
+TOKEN_PATTERN = re.compile(r'(\w+):("[^"]*"|\S+)|"([^"]*)"|/((?:\\.|[^/])*)/|(\S+)')
+
+# sign:Flying>50, the percentage is compared against the tag's chance
+SIGN_PATTERN = re.compile(r'^(.*?)(>=|<=|>|<|=)(\d+)%?$')
+
+# YYYY, YYYY-MM or YYYY-MM-DD
+DATE_PATTERN = re.compile(r'^\d{4}(-(0[1-9]|1[0-2])(-(0[1-9]|[12]\d|3[01]))?)?$')
+
+# A parsed query, each part is a list
+ParsedQuery = namedtuple("ParsedQuery", ["fields", "dates", "signs", "phrases", "regexes", "words"])
+
+class QueryError(ValueError):
+    """A query that can't be understood, e.g. date:2024/02"""
+
+def parse_query(text):
+    """
+    Split a query into its metadata filters and its text searches.
+
+    Arguments:
+        text (str): The query.
+
+    Returns:
+        ParsedQuery: The query's parts.
+
+    Raises:
+        QueryError: If a date in the query isn't YYYY, YYYY-MM or YYYY-MM-DD.
+    """
+    query = ParsedQuery([], [], [], [], [], [])
+
+    for match in TOKEN_PATTERN.finditer(text):
+        name, value, phrase, regex, word = match.groups()
+        if name is not None:
+            name = name.lower()
+            value = value.strip('"')
+            if name in FIELD_NAMES:
+                query.fields.append((FIELD_NAMES[name], value))
+            elif name == "date":
+                query.dates.append(date_range(value))
+            elif name in ("sign", "tag"):
+                query.signs.append(sign_filter(value))
+            else:
+                query.words.append(match.group())
+        elif phrase is not None:
+            query.phrases.append(phrase)
+        elif regex is not None:
+            query.regexes.append(regex)
+        else:
+            query.words.append(word)
+
+    return query
+
+def period_end(date):
+    """
+    Get the first date after a period given as YYYY, YYYY-MM or YYYY-MM-DD.
+
+    Arguments:
+        date (str): The period.
+
+    Returns:
+        str: The (exclusive) end of the period, comparable with YYYY-MM-DD strings.
+    """
+    parts = date.split("-")
+    if len(parts) == 1:
+        return f"{int(parts[0]) + 1:04d}"
+    if len(parts) == 2:
+        year, month = int(parts[0]), int(parts[1])
+        return f"{year + 1:04d}-01" if month == 12 else f"{year:04d}-{month + 1:02d}"
+    # Any suffix sorts after the day itself
+    return date + "~"
+
+def date_range(value):
+    """
+    Turn 2024-01..2024-06, 2024..2025, 2024-03-05, 2024.. or ..2024-06 into a range.
+
+    Arguments:
+        value (str): The date value of the query.
+
+    Returns:
+        tuple: (start, end) where start is inclusive, end exclusive, and either may be None.
+
+    Raises:
+        QueryError: If either end isn't YYYY, YYYY-MM or YYYY-MM-DD.
+    """
+    if ".." in value:
+        start, _, end = value.partition("..")
+    else:
+        start = end = value
+    for date in (start, end):
+        if date and not DATE_PATTERN.match(date):
+            raise QueryError(f"Invalid date: {date}")
+        # The pattern lets days like 2024-02-30 through, the calendar doesn't
+        if date and date.count("-") == 2:
+            try:
+                calendar_date.fromisoformat(date)
+            except ValueError:
+                raise QueryError(f"Invalid date: {date}")
+    return (start or None, period_end(end) if end else None)
+
+def sign_filter(value):
+    """
+    Turn Flying, Flying>50 or Flying<=30 into a dream sign filter.
+
+    Arguments:
+        value (str): The sign value of the query.
+
+    Returns:
+        tuple: (tag, operator, percent), the operator and percent are None when only the tag is given.
+    """
+    match = SIGN_PATTERN.match(value)
+    if match:
+        return (match.group(1), match.group(2), int(match.group(3)))
+    return (value, None, None)
+
+class EntryQuery:
+    def __init__(self, catalog, search_index):
+        """
+        Evaluate queries against the catalog's indexes.
+
+        Arguments:
+            catalog (Catalog): The catalog to filter.
+            search_index (SearchIndex): Used for the query's text parts.
+        """
+        self.catalog = catalog
+        self.search_index = search_index
+        self.connection = catalog.connection
+
+    def _field_ids(self, field, value):
+        rows = self.connection.execute(
+            "SELECT entry_id FROM fields WHERE field = ? AND value = ?", (field, value)
+        )
+        return {row[0] for row in rows}
+
+    def _date_ids(self, start, end):
+        query = "SELECT id FROM entries WHERE date IS NOT NULL"
+        params = []
+        if start:
+            query += " AND date >= ?"
+            params.append(start)
+        if end:
+            query += " AND date < ?"
+            params.append(end)
+        return {row[0] for row in self.connection.execute(query, params)}
+
+    def run(self, text):
+        """
+        Find the entries matching every part of a query.
+
+        Arguments:
+            text (str): The query.
+
+        Returns:
+            list: SearchHit tuples, best text match first, then newest first.
+
+        Raises:
+            re.error: If a /regex/ in the query is not a valid regular expression.
+            QueryError: If the query can't be understood.
+        """
+        query = parse_query(text)
+        ids = None
+        text_hits = {}
+
+        def narrow(matching):
+            return matching if ids is None else ids & matching
+
+        for field, value in query.fields:
+            ids = narrow(self._field_ids(field, value))
+        for start, end in query.dates:
+            ids = narrow(self._date_ids(start, end))
+        for sign in query.signs:
+            ids = narrow(self.catalog.sign_entries(*sign))
+
+        # Text searches, combining their scores and match offsets
+        searches = [self.search_index.grep(re.escape(phrase)) for phrase in query.phrases]
+        searches += [self.search_index.grep(regex) for regex in query.regexes]
+        if query.words:
+            searches.append(self.search_index.rank(" ".join(query.words)))
+        for hits in searches:
+            ids = narrow({hit.entry_id for hit in hits})
+            for hit in hits:
+                score, offsets = text_hits.get(hit.entry_id, (0, []))
+                text_hits[hit.entry_id] = (score + hit.score, offsets + hit.offsets)
+
+        if not ids:
+            return []
+
+        results = []
+        for chunk, marks in chunked(ids):
+            for row in self.connection.execute(
+                f"SELECT id, path, title, date, created FROM entries WHERE id IN ({marks})", chunk
+            ):
+                score, offsets = text_hits.get(row["id"], (0, []))
+                results.append((row["date"] or "", row["created"] or 0, SearchHit(
+                    row["id"], row["path"], row["title"], row["date"], score, sorted(offsets)
+                )))
+
+        results.sort(key=lambda result: (result[2].score, result[0], result[1]), reverse=True)
+        return [hit for _, _, hit in results]
+
+    def find(self, text):
+        """
+        Run a search typed by the user, either a structured query or a plain search.
+
+        Arguments:
+            text (str): The search.
+
+        Returns:
+            list: SearchHit tuples, best match first.
+
+        Raises:
+            re.error: If a /regex/ in the search is not a valid regular expression.
+            QueryError: If the query can't be understood.
+        """
+        query = parse_query(text)
+        if query.fields or query.dates or query.signs:
+            return self.run(text)
+        return self.search_index.find(text)
+
+    def highlight_pattern(self, text):
+        """
+        Get the regex that highlights what the text parts of a search matched.
+
+        Arguments:
+            text (str): The search.
+
+        Returns:
+            str: A regular expression.
+        """
+        query = parse_query(text)
+        if not (query.fields or query.dates or query.signs):
+            return self.search_index.highlight_pattern(text)
+
+        patterns = [re.escape(phrase) for phrase in query.phrases] + query.regexes
+        if query.words:
+            patterns.append(self.search_index.highlight_pattern(" ".join(query.words)))
+        # Nothing to highlight when the query only filters metadata
+        return "|".join(f"(?:{pattern})" for pattern in patterns) or "(?!)"
@@ -0,0 +1,307 @@
+# Search class
+# Full-text search over the entries stored in a catalog
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import re
+from collections import defaultdict, namedtuple
+from rich.text import Text
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# How many characters of context a result snippet shows
+SNIPPET_BEFORE = 30
+SNIPPET_LENGTH = 90
+
+# Escapes that stand for a class of characters or a position, not for text
+CLASS_ESCAPES = frozenset("bBdDsSwWAZ")
+
+# Flags that can be switched on inside a pattern, e.g. (?x) or (?i:...)
+INLINE_FLAGS = frozenset("aiLmsux-")
+
+# A search result, offsets holds (offset, length) of every regex match (ranked hits leave it empty)
+SearchHit = namedtuple("SearchHit", ["entry_id", "path", "title", "date", "score", "offsets"])
+
+def tokenize(text):
+    """
+    Split a text into lowercase terms and remember where each one occurs.
+
+    Arguments:
+        text (str): The text to index.
+
+    Returns:
+        dict: {term: [character offsets]}
+    """
+    postings = defaultdict(list)
+    for match in WORD_PATTERN.finditer(text.lower()):
+        postings[match.group()].append(match.start())
+    return postings
+
+def trigrams(text):
+    """
+    Get every three character sequence of a text. The case is left alone, the
+    fts5 index folds it the same way for the text and for the query.
+
+    Arguments:
+        text (str): The text to look up.
+
+    Returns:
+        set: The trigrams.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def required_literals(pattern):
+    """
+    Find the plain text fragments every match of a regex has to contain. The scan is
+    conservative: groups, classes and anything optional are skipped, and a top level
+    alternation, an inline flag or an escape with an argument (\\x66, \\1, \\N{...})
+    means nothing is required at all.
+
+    Arguments:
+        pattern (str): The regular expression.
+
+    Returns:
+        list: The required fragments (possibly empty).
+    """
+    literals = []
+    current = ""
+    depth = 0
+    i = 0
+
+    while i < len(pattern):
+        char = pattern[i]
+
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped.isalnum() and escaped not in CLASS_ESCAPES:
+                # \x66, \u0066, \N{...}, \146, \1, \n: what they match isn't spelled out here
+                return []
+            if depth == 0:
+                if escaped.isalnum():
+                    # \b, \w, \d, ... are not plain text
+                    literals.append(current)
+                    current = ""
+                else:
+                    current += escaped
+            continue
+
+        if char == "[":
+            # Skip the whole character class
+            literals.append(current)
+            current = ""
+            i += 1
+            if i < len(pattern) and pattern[i] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+        elif char == "(":
+            if pattern.startswith("(?", i) and i + 2 < len(pattern) and pattern[i + 2] in INLINE_FLAGS:
+                # (?x) ignores spaces, (?i) changes case, ... the text no longer means what it says
+                return []
+            depth += 1
+            literals.append(current)
+            current = ""
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif char == "|" and depth == 0:
+            return []
+        elif depth == 0:
+            if char in "*?{":
+                # The previous character is optional (or repeated a variable number of times)
+                literals.append(current[:-1])
+                current = ""
+                if char == "{":
+                    closing = pattern.find("}", i)
+                    i = closing if closing != -1 else len(pattern)
+            elif char in ".^$+":
+                # A '+' still requires the character before it once, so it stays in the fragment
+                literals.append(current)
+                current = ""
+            else:
+                current += char
+        i += 1
+
+    literals.append(current)
+    return [literal for literal in literals if len(literal) >= 3]
+
+def chunked(ids, size=900):
+    # Stay under sqlite's limit on the number of query parameters
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        chunk = ids[start:start + size]
+        yield chunk, ','.join('?' * len(chunk))
+
+class SearchIndex:
+    def __init__(self, catalog):
+        """
+        Search the fts5 word and trigram indexes kept by a catalog.
+
+        Arguments:
+            catalog (Catalog): The catalog holding the indexes.
+        """
+        self.catalog = catalog
+        self.connection = catalog.connection
+
+    def rank(self, query):
+        """
+        Rank the entries containing every word of the query by BM25 relevance.
+
+        Arguments:
+            query (str): The words to look for.
+
+        Returns:
+            list: SearchHit tuples, best match first.
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+
+        # Quoted, so words like 'and' or 'near' aren't read as fts5 operators
+        match = " AND ".join(f'"{term}"' for term in terms)
+        # fts5's bm25() uses the usual k1 = 1.2 and b = 0.75, and is lower for better matches
+        rows = self.connection.execute(
+            "SELECT entries.id, path, title, date, bm25(words) AS rank FROM words "
+            "JOIN entries ON entries.id = words.rowid WHERE words MATCH ? ORDER BY rank", (match,)
+        )
+        return [SearchHit(row["id"], row["path"], row["title"], row["date"], -row["rank"], []) for row in rows]
+
+    def candidates(self, literals):
+        """
+        Narrow a search down to the entries holding every trigram of the given fragments.
+
+        Arguments:
+            literals (list): Text fragments every match contains.
+
+        Returns:
+            set: The candidate entry ids, or None if the fragments don't narrow anything down.
+        """
+        grams = set()
+        for literal in literals:
+            grams |= trigrams(literal)
+        if not grams:
+            return None
+
+        # The index keeps no positions, so every trigram is looked up as a token of its own
+        match = " AND ".join('"' + gram.replace('"', '""') + '"' for gram in grams)
+        return {row[0] for row in self.connection.execute(
+            "SELECT rowid FROM contents WHERE contents MATCH ?", (match,)
+        )}
+
+    def grep(self, pattern):
+        """
+        Find the entries matching a regular expression (case-insensitive). The trigram index
+        picks the candidates, and the regex only runs over their stored text.
+
+        Arguments:
+            pattern (str): The regular expression.
+
+        Returns:
+            list: SearchHit tuples, most matches first.
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression.
+        """
+        regex = re.compile(pattern, re.IGNORECASE)
+        candidates = self.candidates(required_literals(pattern))
+
+        if candidates is None:
+            rows = self.connection.execute(
+                "SELECT entries.id, path, title, date, content FROM entries JOIN contents ON contents.rowid = entries.id"
+            ).fetchall()
+        else:
+            rows = []
+            for chunk, marks in chunked(candidates):
+                rows.extend(self.connection.execute(
+                    "SELECT entries.id, path, title, date, content FROM entries "
+                    f"JOIN contents ON contents.rowid = entries.id WHERE entries.id IN ({marks})", chunk
+                ))
+
+        hits = []
+        for row in rows:
+            offsets = [(match.start(), match.end() - match.start()) for match in regex.finditer(row["content"])]
+            if offsets:
+                hits.append(SearchHit(row["id"], row["path"], row["title"], row["date"], len(offsets), offsets))
+
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+        return hits
+
+    def find(self, query):
+        """
+        Run a search typed by the user: /regex/, "exact text" or plain keywords.
+
+        Arguments:
+            query (str): The search.
+
+        Returns:
+            list: SearchHit tuples, best match first.
+
+        Raises:
+            re.error: If a /regex/ search is not a valid regular expression.
+        """
+        query = query.strip()
+        if len(query) > 2 and query.startswith("/") and query.endswith("/"):
+            return self.grep(query[1:-1])
+        if len(query) > 2 and query.startswith('"') and query.endswith('"'):
+            return self.grep(re.escape(query[1:-1]))
+        return self.rank(query)
+
+    def highlight_pattern(self, query):
+        """
+        Get the regex that highlights what a search matched.
+
+        Arguments:
+            query (str): The search, as given to find().
+
+        Returns:
+            str: A regular expression.
+        """
+        query = query.strip()
+        if len(query) > 2 and query.startswith("/") and query.endswith("/"):
+            return query[1:-1]
+        if len(query) > 2 and query.startswith('"') and query.endswith('"'):
+            return re.escape(query[1:-1])
+        words = [re.escape(word) for word in tokenize(query)]
+        return rf"\b(?:{'|'.join(words)})\b" if words else re.escape(query)
+
+    def snippets(self, hits, pattern=None):
+        """
+        Build a highlighted snippet around the first match of each hit, from the
+        stored text so no entry file is opened.
+
+        Arguments:
+            hits (list): The SearchHit tuples to build snippets for.
+            pattern (str): What the search matched (see highlight_pattern), the hits'
+                           own offsets are used when None.
+
+        Returns:
+            dict: {entry id: rich Text}
+        """
+        regex = re.compile(pattern, re.IGNORECASE) if pattern else None
+        contents = {}
+        for chunk, marks in chunked(hit.entry_id for hit in hits):
+            contents.update(self.connection.execute(
+                f"SELECT rowid, content FROM contents WHERE rowid IN ({marks})", chunk
+            ).fetchall())
+
+        snippets = {}
+        for hit in hits:
+            content = contents.get(hit.entry_id, "")
+            offsets = hit.offsets
+            if regex:
+                offsets = [(match.start(), match.end() - match.start()) for match in regex.finditer(content)]
+            first = offsets[0][0] if offsets else 0
+            start = max(0, first - SNIPPET_BEFORE)
+            end = min(len(content), start + SNIPPET_LENGTH)
+
+            snippet = Text("..." if start > 0 else "")
+            prefix = len(snippet)
+            snippet.append(content[start:end].replace("\n", " "))
+            for offset, length in offsets:
+                if start <= offset and offset + length <= end:
+                    snippet.stylize("bold yellow", prefix + offset - start, prefix + offset - start + length)
+            if end < len(content):
+                snippet.append("...")
+            snippets[hit.entry_id] = snippet
+        return snippets
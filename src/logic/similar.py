@@ -0,0 +1,193 @@
+# Similar class
+# Finds near-duplicate entries with MinHash signatures and locality-sensitive hashing
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import re
+import zlib
+from collections import defaultdict, namedtuple
+import numpy as np
+
+# Classes
+from .catalog import entry_body, TAG_PATTERN
+from .search import chunked
+
+# Entries are compared as sets of overlapping 3 word phrases
+SHINGLE_SIZE = 3
+
+# 64 hash functions split into 16 bands of 4 rows: two entries become candidates once
+# any band matches, which is likely from about 50% similarity up
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS = NUM_PERMUTATIONS // BANDS
+
+# Candidates are only reported when their estimated similarity is at least this
+SIMILARITY_THRESHOLD = 0.7
+
+# A prime just above 2^32, the permutations are (a * x + b) % HASH_PRIME. With 32 bit
+# hashes x and a, b below COEFFICIENT_LIMIT, a * x + b stays under 2^63, so the uint64
+# arithmetic never wraps before the modulo
+HASH_PRIME = np.uint64(4294967311)
+COEFFICIENT_LIMIT = 2 ** 31
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# One entry of a near-duplicate cluster, similarity is estimated against the cluster's first entry
+SimilarEntry = namedtuple("SimilarEntry", ["path", "title", "date", "similarity"])
+
+def shingles(content):
+    """
+    Split an entry's body into its overlapping word phrases.
+
+    Arguments:
+        content (str): The entry's text.
+
+    Returns:
+        set: 32 bit hashes of the phrases.
+    """
+    words = WORD_PATTERN.findall(TAG_PATTERN.sub(" ", entry_body(content)).lower())
+    if len(words) < SHINGLE_SIZE:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode("utf-8"))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+class MinHasher:
+    def __init__(self, num_permutations=NUM_PERMUTATIONS, seed=1):
+        """
+        Turn sets of hashes into MinHash signatures.
+
+        Arguments:
+            num_permutations (int): How many hash functions make up a signature.
+            seed (int): Fixes the hash functions, so signatures can be compared across runs.
+        """
+        generator = np.random.default_rng(seed)
+        self.a = generator.integers(1, COEFFICIENT_LIMIT, size=num_permutations, dtype=np.uint64)
+        self.b = generator.integers(0, COEFFICIENT_LIMIT, size=num_permutations, dtype=np.uint64)
+
+    def signature(self, hashes):
+        """
+        Get the MinHash signature of a set of hashes.
+
+        Arguments:
+            hashes (set): 32 bit hashes, e.g. from shingles().
+
+        Returns:
+            numpy.ndarray: The smallest permuted hash for every hash function.
+        """
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        # One row per hash function, one column per shingle
+        permuted = (np.outer(self.a, values) + self.b[:, None]) % HASH_PRIME
+        return permuted.min(axis=1)
+
+class SimilarityIndex:
+    def __init__(self, catalog):
+        """
+        Find entries that read almost the same, using the text stored in a catalog.
+
+        Arguments:
+            catalog (Catalog): The catalog holding the entries' text.
+        """
+        self.catalog = catalog
+        self.connection = catalog.connection
+        self.hasher = MinHasher()
+
+    def signatures(self):
+        """
+        Compute the MinHash signature of every entry with enough text.
+
+        Returns:
+            dict: {entry id: signature}
+        """
+        signatures = {}
+        for row in self.connection.execute("SELECT rowid AS entry_id, content FROM contents"):
+            hashes = shingles(row["content"])
+            if hashes:
+                signatures[row["entry_id"]] = self.hasher.signature(hashes)
+        return signatures
+
+    def candidate_pairs(self, signatures):
+        """
+        Bucket every signature band by band, only entries sharing a bucket are compared.
+
+        Arguments:
+            signatures (dict): {entry id: signature}
+
+        Returns:
+            set: (entry id, entry id) pairs, smaller id first.
+        """
+        pairs = set()
+        for band in range(BANDS):
+            buckets = defaultdict(list)
+            for entry_id, signature in signatures.items():
+                buckets[signature[band * ROWS:(band + 1) * ROWS].tobytes()].append(entry_id)
+            for bucket in buckets.values():
+                if len(bucket) > 1:
+                    bucket.sort()
+                    pairs.update(
+                        (bucket[i], bucket[j]) for i in range(len(bucket)) for j in range(i + 1, len(bucket))
+                    )
+        return pairs
+
+    def clusters(self, threshold=SIMILARITY_THRESHOLD):
+        """
+        Group the entries that are near copies of each other.
+
+        Arguments:
+            threshold (float): The lowest estimated similarity (0 to 1) that counts as a near copy.
+
+        Returns:
+            list: One list of SimilarEntry tuples per cluster, oldest entry first,
+                  biggest cluster first.
+        """
+        signatures = self.signatures()
+
+        # Union-find over the pairs that really are similar
+        parent = {}
+
+        def find(entry_id):
+            while parent[entry_id] != entry_id:
+                # Halve the path on the way up so later lookups stay short
+                parent[entry_id] = parent[parent[entry_id]]
+                entry_id = parent[entry_id]
+            return entry_id
+
+        for first, second in self.candidate_pairs(signatures):
+            if np.mean(signatures[first] == signatures[second]) >= threshold:
+                parent.setdefault(first, first)
+                parent.setdefault(second, second)
+                parent[find(second)] = find(first)
+
+        groups = defaultdict(list)
+        for entry_id in parent:
+            groups[find(entry_id)].append(entry_id)
+        if not groups:
+            return []
+
+        details = {}
+        members = [entry_id for group in groups.values() for entry_id in group]
+        for chunk, marks in chunked(members):
+            for row in self.connection.execute(
+                f"SELECT id, path, title, date, created FROM entries WHERE id IN ({marks})", chunk
+            ):
+                details[row["id"]] = row
+
+        clusters = []
+        for group in groups.values():
+            group = [entry_id for entry_id in group if entry_id in details]
+            group.sort(key=lambda entry_id: (details[entry_id]["created"] or 0, details[entry_id]["path"]))
+            if len(group) < 2:
+                continue
+            first = signatures[group[0]]
+            clusters.append([
+                SimilarEntry(
+                    details[entry_id]["path"], details[entry_id]["title"], details[entry_id]["date"],
+                    float(np.mean(signatures[entry_id] == first)),
+                )
+                for entry_id in group
+            ])
+
+        clusters.sort(key=len, reverse=True)
+        return clusters
@@ -0,0 +1,122 @@
+# Streaks class
+# Keeps one bit per calendar day with an entry and measures the streaks and gaps between them
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+import numpy as np
+
+# The streak figures shown on the analytics screens
+StreakStats = namedtuple("StreakStats", ["current", "longest", "days", "gaps", "longest_gap"])
+
+def parse_day(day):
+    # Days are stored as YYYY-MM-DD strings in the catalog
+    return day if isinstance(day, date) else datetime.strptime(day, "%Y-%m-%d").date()
+
+class DayIndex:
+    def __init__(self, days=()):
+        """
+        A bitmap with one bit per calendar day, starting at the first day with an entry.
+
+        Arguments:
+            days (iterable): The days (YYYY-MM-DD or date) that have at least one entry.
+        """
+        self.origin = None
+        self.length = 0
+        self.bits = bytearray()
+        for day in days:
+            self.add(day)
+
+    def _grow(self, day):
+        """
+        Make the bitmap reach a day, shifting it if the day comes before the origin.
+
+        Arguments:
+            day (date): The day the bitmap has to cover.
+
+        Returns:
+            int: The day's bit position.
+        """
+        if self.origin is None:
+            self.origin = day
+        offset = (day - self.origin).days
+
+        if offset < 0:
+            # Rare (an entry older than every other one), so the whole bitmap is rebuilt
+            present = np.unpackbits(np.frombuffer(bytes(self.bits), dtype=np.uint8), count=self.length)
+            present = np.concatenate((np.zeros(-offset, dtype=np.uint8), present))
+            self.bits = bytearray(np.packbits(present).tobytes())
+            self.length = len(present)
+            self.origin = day
+            offset = 0
+
+        if offset >= self.length:
+            self.length = offset + 1
+            self.bits.extend(bytes((self.length + 7) // 8 - len(self.bits)))
+        return offset
+
+    def add(self, day):
+        """
+        Mark a day as having an entry.
+
+        Arguments:
+            day (str | date): The day.
+        """
+        offset = self._grow(parse_day(day))
+        self.bits[offset // 8] |= 0x80 >> (offset % 8)
+
+    def remove(self, day):
+        """
+        Mark a day as having no entries anymore.
+
+        Arguments:
+            day (str | date): The day.
+        """
+        if self.origin is None:
+            return
+        offset = (parse_day(day) - self.origin).days
+        if 0 <= offset < self.length:
+            self.bits[offset // 8] &= ~(0x80 >> (offset % 8)) & 0xFF
+
+    def __contains__(self, day):
+        if self.origin is None:
+            return False
+        offset = (parse_day(day) - self.origin).days
+        return 0 <= offset < self.length and bool(self.bits[offset // 8] & (0x80 >> (offset % 8)))
+
+    def stats(self, today=None):
+        """
+        Measure the streaks with run-length operations over the bitmap.
+
+        Arguments:
+            today (date): The day the current streak is measured from, defaults to today.
+
+        Returns:
+            StreakStats: The current and longest streak, the number of days with an entry,
+                         the number of gaps between them and the longest gap (all in days).
+        """
+        present = np.unpackbits(np.frombuffer(bytes(self.bits), dtype=np.uint8), count=self.length)
+        if not present.any():
+            return StreakStats(0, 0, 0, 0, 0)
+
+        # A run starts where the bit goes 0 -> 1 and ends where it goes 1 -> 0
+        edges = np.diff(np.concatenate(([0], present.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        runs = ends - starts
+        gaps = starts[1:] - ends[:-1]
+
+        # The streak is still going if the last entry was written today or yesterday
+        today = today or date.today()
+        last_day = self.origin + timedelta(days=int(ends[-1]) - 1)
+        current = int(runs[-1]) if (today - last_day).days <= 1 else 0
+
+        return StreakStats(
+            current=current,
+            longest=int(runs.max()),
+            days=int(runs.sum()),
+            gaps=len(gaps),
+            longest_gap=int(gaps.max()) if len(gaps) else 0,
+        )
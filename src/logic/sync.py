@@ -0,0 +1,194 @@
+# Sync class
+# Streams the entries out of a sync export one at a time, last entry first
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import os
+import re
+
+# Classes
+from .catalog import directory_date, content_fingerprint
+
+# Every entry in a sync file starts with this line
+ENTRY_DELIMITER = "=============================="
+SEPARATOR = "───────────────────────────────────────────────────────────────────────"
+
+# Entry files end in _YYYYmmdd_HHMMSS_ffffff.txt
+TIMESTAMP_SUFFIX = re.compile(r'_\d{8}_\d{6}_\d{6}$')
+
+# How much of the file is read at a time, walking backwards from the end
+BLOCK_SIZE = 64 * 1024
+
+# Header lines of a dream entry -> the key they are stored under
+DREAM_FIELDS = {
+    "Dream Type:": "Dream Type",
+    "Technique:": "Technique",
+    "Sleep Cycle:": "Sleep Cycle",
+}
+
+def reverse_lines(file_path, block_size=BLOCK_SIZE):
+    """
+    Read a file's lines from the last one to the first, one block at a time.
+
+    Arguments:
+        file_path (str): The file to read.
+        block_size (int): How many bytes are read at once.
+
+    Yields:
+        tuple: (line, bytes read so far), the line without its newline.
+    """
+    with open(file_path, 'rb') as file:
+        position = file.seek(0, os.SEEK_END)
+        size = position
+        remainder = b""
+        at_end = True
+
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            file.seek(position)
+            lines = (file.read(step) + remainder).split(b"\n")
+            # The first line may continue in the block before this one
+            remainder = lines.pop(0)
+            if at_end and lines and lines[-1] == b"":
+                # The file's final newline doesn't start another line
+                lines.pop()
+            at_end = False
+            for line in reversed(lines):
+                # '\n' never shows up inside a multi-byte UTF-8 character, so each line decodes on its own
+                yield line.decode("utf-8", errors="replace"), size - position
+
+        yield remainder.decode("utf-8", errors="replace"), size
+
+def parse_sync_entry(lines, fields):
+    """
+    Turn the lines of one sync entry (after its delimiter) into an entry.
+
+    Arguments:
+        lines (iterable): The entry's lines, in file order.
+        fields (dict): Header line prefixes -> the key they are stored under, e.g. DREAM_FIELDS.
+
+    Returns:
+        dict: The entry's Date, Title, Body and fields.
+    """
+    entry = {"Date": "", "Title": "", "Body": ""}
+    entry.update({key: "" for key in fields.values()})
+    capture_body = False
+
+    for line in lines:
+        # Remove leading and trailing spaces
+        line = line.strip()
+
+        if line.startswith("[ (") and "|" in line:
+            # Extract title and date
+            parts = line.split("|")
+            entry["Title"] = parts[0].strip("[ (")[:-1].strip()
+            entry["Date"] = parts[1].strip(") ]")[1:].strip()
+            continue
+
+        prefix = next((prefix for prefix in fields if line.startswith(prefix)), None)
+        if prefix:
+            entry[fields[prefix]] = line.split(":")[1].strip()
+        elif line.startswith(SEPARATOR):
+            # Don't capture the separator line itself, but keep the capture process going
+            continue
+        elif capture_body:
+            if entry["Body"]:
+                entry["Body"] += "\n"
+            entry["Body"] += line
+
+        # Start capturing body after separator
+        elif line and capture_body is False:
+            capture_body = True
+            entry["Body"] = line
+
+    return entry
+
+def read_sync_entries(file_path, fields=None, block_size=BLOCK_SIZE):
+    """
+    Stream the entries of a sync file from the last one to the first, so only one
+    entry is ever held in memory. Entries without a body are skipped.
+
+    Arguments:
+        file_path (str): The sync file.
+        fields (dict): Header line prefixes -> the key they are stored under, e.g. DREAM_FIELDS.
+        block_size (int): How many bytes are read at once.
+
+    Yields:
+        tuple: (entry, bytes read so far)
+    """
+    lines = []
+    for line, read in reverse_lines(file_path, block_size):
+        if line.strip() != ENTRY_DELIMITER:
+            lines.append(line)
+            continue
+
+        entry = parse_sync_entry(reversed(lines), fields or {})
+        lines = []
+        if entry["Body"]:
+            yield entry, read
+    # Lines left over came before the first delimiter, they aren't part of an entry
+
+def normalize_title(title):
+    # 'Flying  Dream', 'Flying_Dream' and 'flying dream' are the same entry
+    return " ".join(title.replace("_", " ").split()).casefold()
+
+def file_key(file_path):
+    """
+    Get the dedup key of an entry file from its folders and its name.
+
+    Arguments:
+        file_path (str): The entry's path.
+
+    Returns:
+        tuple: (YYYY-MM-DD, normalized title)
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return (directory_date(file_path), normalize_title(TIMESTAMP_SUFFIX.sub("", stem)))
+
+class DedupCache:
+    def __init__(self, file_paths, fingerprints=()):
+        """
+        What is already in the vault, built once per sync: the (date, title) of every entry
+        and the fingerprint of its content.
+
+        Arguments:
+            file_paths (iterable): The vault's entry paths, e.g. from the catalog.
+            fingerprints (iterable): The vault's content fingerprints, e.g. from the catalog.
+        """
+        self.keys = {file_key(file_path) for file_path in file_paths}
+        self.fingerprints = set(fingerprints)
+
+    def seen(self, key, content):
+        """
+        Check whether an entry is already in the vault, by date and title or by content.
+
+        Arguments:
+            key (tuple): The entry's (date, title) key, see DedupCache.key().
+            content (str): The entry's text, as it would be written.
+
+        Returns:
+            bool: True if it is a duplicate.
+        """
+        return key in self.keys or content_fingerprint(content) in self.fingerprints
+
+    def add(self, key, content):
+        self.keys.add(key)
+        fingerprint = content_fingerprint(content)
+        if fingerprint:
+            self.fingerprints.add(fingerprint)
+
+    @staticmethod
+    def key(date, title):
+        """
+        Get the dedup key of an entry that is about to be synced.
+
+        Arguments:
+            date (str): The entry's date (YYYY-MM-DD).
+            title (str): The entry's title.
+
+        Returns:
+            tuple: (YYYY-MM-DD, normalized title)
+        """
+        return (date, normalize_title(title))
@@ -1,16 +1,10 @@
 import os
-import re
 import sys
 import termios
 import tty
-from datetime import datetime
-# Classes
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils.imports import *
-# Settings.json
-script_dir = os.path.dirname(os.path.abspath(__file__))
-settings_file_path = os.path.join(script_dir, '..', 'settings.json')
-logs = Logger(settings_file=settings_file_path)
+from collections import namedtuple
+# Only what the helpers need: utils.imports loads the handlers, which import this module
+from rich import print
 
 # A dictionary to map month names to numbers for formatting purposes.
 MONTHS_REVERSED = {
@@ -19,32 +13,64 @@ MONTHS_REVERSED = {
     "September": "09", "October": "10", "November": "11", "December": "12"
 }
 
+# How much of a file we read to get its header, the first 5 lines fit well within this
+HEADER_BYTES = 4096
+
+# Header lines look like 'Dream Type: Lucid'
+HEADER_FIELDS = {
+    "Dream Type": "dream_type",
+    "Technique": "technique",
+    "Sleep Cycle": "sleep_cycle",
+}
+
+# The metadata at the top of an entry (journals leave the dream fields empty)
+EntryHeader = namedtuple("EntryHeader", ["title", "date", "dream_type", "technique", "sleep_cycle"])
+
 class Helpers:
     @staticmethod
-    def extract_date_from_file(file_path):
+    def parse_header(content):
         """
-        Extract the dream date from a file.
+        Parse the header lines (title/date, Dream Type, Technique, Sleep Cycle) of an entry.
+
+        Arguments:
+            content (str): The entry's text, only its first 5 lines are looked at.
+
+        Returns:
+            EntryHeader: The header, with empty strings for missing fields.
+        """
+        # Cut before splitting, so the body isn't copied along with the last line
+        lines = content[:HEADER_BYTES].split("\n", 5)
+        fields = {"title": "", "date": "", "dream_type": "", "technique": "", "sleep_cycle": ""}
+
+        # [ (Title) | (19 January, 2025) ]
+        title_date = lines[0].strip(" []").split(" | ")
+        fields["title"] = title_date[0].strip("()")
+        if len(title_date) > 1:
+            fields["date"] = title_date[1].strip("()")
+
+        for line in lines[2:5]:
+            key, _, value = line.partition(":")
+            if key.strip() in HEADER_FIELDS:
+                fields[HEADER_FIELDS[key.strip()]] = value.strip()
+
+        return EntryHeader(**fields)
+
+    @staticmethod
+    def read_header(file_path):
+        """
+        Read only the header of an entry, no matter how long its body is.
 
         Arguments:
             file_path (str): The file's path to read.
 
         Returns:
-            str: The extracted date or 'DirtyEntry' if the date is missing or an error occurs.
+            EntryHeader: The parsed header.
         """
-        try:
-            date_pattern = r"\[.*\| (.*) \]"
-
-            with open(file_path, 'r') as file:
-                content = file.read()
-                match = re.search(date_pattern, content)
-                if match:
-                    return match.group(1).replace("(", "")
-                else:
-                    print("Date pattern not found in file.")
-                    return 'DirtyEntry'
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
-            return 'DirtyEntry'
+        with open(file_path, 'rb') as file:
+            prefix = file.read(HEADER_BYTES)
+
+        # The prefix may end in the middle of a character, which we don't need anyway
+        return Helpers.parse_header(prefix.decode('utf-8', errors='ignore'))
 
     @staticmethod
     def date_formatter(date_unformatted, flipped, bracket_bug=False):
@@ -96,50 +122,69 @@ class Helpers:
         return creation_time
 
     @staticmethod
-    def list_files(directory):
+    def _date_folders(directory, key):
+        """
+        List the sub folders of a directory whose name the key understands, largest key first.
+
+        Arguments:
+            directory (str): The directory to look in.
+            key (function): Turns a folder name into a sortable value, raising ValueError or KeyError otherwise.
+
+        Returns:
+            list: Paths of the matching folders.
+        """
+        folders = []
+        try:
+            with os.scandir(directory) as iterator:
+                for dir_entry in iterator:
+                    if dir_entry.is_dir():
+                        try:
+                            folders.append((key(dir_entry.name), dir_entry.path))
+                        except (ValueError, KeyError):
+                            pass  # Not part of the year/month/day layout
+        except FileNotFoundError:
+            return []
+
+        folders.sort(reverse=True)
+        return [path for _, path in folders]
+
+    @staticmethod
+    def walk_entries(directory):
+        """
+        Lazily yield entry paths newest first without opening any file. The order comes from
+        the year/MonthName/day folders and the timestamp in each file name, so only the
+        folders leading to the entries that are consumed get read.
+
+        Arguments:
+            directory (str): The journal directory.
+
+        Yields:
+            str: The path of each entry.
+        """
+        for year_path in Helpers._date_folders(directory, int):
+            for month_path in Helpers._date_folders(year_path, lambda name: int(MONTHS_REVERSED[name])):
+                for day_path in Helpers._date_folders(month_path, int):
+                    with os.scandir(day_path) as iterator:
+                        file_names = [
+                            dir_entry.name for dir_entry in iterator
+                            if dir_entry.name.endswith(".txt") and dir_entry.is_file()
+                        ]
+                    file_names.sort(key=Helpers.extract_creation_time, reverse=True)
+                    for file_name in file_names:
+                        yield os.path.join(day_path, file_name)
+
+    @staticmethod
+    def newest_entry(directory):
         """
-        List all text files in a directory structure sorted by year, month, day, and creation time.
+        Find the newest entry by following a single year/month/day folder chain.
 
         Arguments:
-            directory (str): The directory to scan.
+            directory (str): The journal directory.
 
         Returns:
-            list: Sorted list of file paths.
+            str: The newest entry's path, or None if there are no entries.
         """
-        files = []
-
-        for root, _, file_names in os.walk(directory):
-            for file_name in file_names:
-                if file_name.endswith(".txt"):
-                    file_path = os.path.join(root, file_name)
-
-                    # Extract the date from the directory structure (year, month, day)
-                    parts = os.path.normpath(root).split(os.sep)
-                    try:
-                        year = int(parts[-3])
-                        month = datetime.strptime(parts[-2], "%B").month
-                        day = int(parts[-1])
-                        file_date = datetime(year, month, day)
-                    except (IndexError, ValueError):
-                        file_date = datetime.min
-                    
-                    extracted_date = Helpers.extract_date_from_file(file_path).replace("(", "")
-                    extracted_date = extracted_date.replace(")", "")
-                    date_object = datetime.strptime(extracted_date, "%d %B, %Y")
-                    file_date = date_object.strftime("%d-%m-%Y")
-                    
-                    # Get the creation time using the extenstion
-                    creation_time = Helpers.extract_creation_time(file_name)
-
-                    # Append the file details to the list
-                    files.append((file_date, creation_time, file_path))
-
-        files.sort(
-            key=lambda entry: (datetime.strptime(entry[0], "%d-%m-%Y"), entry[1]),
-            reverse=True
-        )
-
-        return [file_path for _, _, file_path in files]
+        return next(Helpers.walk_entries(directory), None)
 
     @staticmethod
     def getch():
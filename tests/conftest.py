@@ -0,0 +1,47 @@
+# Test helpers
+# Puts src on the path and writes entries laid out like a real vault
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+SEPARATOR = "───────────────────────────────────────────────────────────────────────"
+
+def write_entry(directory, title, day, body, dream_type="", technique="", sleep_cycle="", stamp=0):
+    """
+    Write an entry the way the dream handler saves one: year/MonthName/day/Title_timestamp.txt
+
+    Arguments:
+        directory (str): The vault.
+        title (str): The entry's title.
+        day (date): The entry's date.
+        body (str): What was written.
+        dream_type, technique, sleep_cycle (str): The header fields.
+        stamp (int): Microseconds of the file name's timestamp, orders entries written on the same day.
+
+    Returns:
+        str: The entry's path.
+    """
+    folder = os.path.join(str(directory), str(day.year), day.strftime("%B"), str(day.day))
+    os.makedirs(folder, exist_ok=True)
+    file_path = os.path.join(folder, f"{title.replace(' ', '_')}_{day:%Y%m%d}_000000_{stamp:06d}.txt")
+    with open(file_path, "w") as file:
+        file.write(
+            f"[ ({title}) | ({day.day} {day.strftime('%B')}, {day.year}) ]\n{SEPARATOR}\n"
+            f"Dream Type: {dream_type}\nTechnique: {technique}\nSleep Cycle: {sleep_cycle}\n{SEPARATOR}\n"
+            f"[ Dream Entry ]\n{SEPARATOR}\n{body}\n"
+        )
+    return file_path
+
+@pytest.fixture
+def vault(tmp_path):
+    # An empty vault, its catalog is created next to it like the handlers' is
+    directory = tmp_path / "dreams"
+    directory.mkdir()
+    return str(directory)
@@ -0,0 +1,100 @@
+# Backup tests
+# Checks that backups get their own names, and that a chain of them is followed
+# back to its full backup and restores the vault
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import os
+import json
+from datetime import date, datetime
+
+import pytest
+
+# Classes
+from conftest import write_entry
+from logic import backup
+from logic.backup import ArchiveIndex, BackupSet, BulkWriter, MANIFEST_SUFFIX, FULL, INCREMENTAL, TAR
+from logic.catalog import scan_entries
+
+class FrozenClock(datetime):
+    # Every backup is taken in the same instant
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 18, 7, 30, 0)
+
+@pytest.fixture
+def backups(vault, tmp_path):
+    write_entry(vault, "Ocean", date(2024, 1, 1), "Flying over the ocean")
+    write_entry(vault, "Stairs", date(2024, 2, 3), "Falling down the stairs")
+    backup_directory = tmp_path / "backups"
+    backup_directory.mkdir()
+    return BackupSet(str(backup_directory), vault, "Dream")
+
+def entry_paths(directory):
+    return sorted(dir_entry.path for dir_entry in scan_entries(directory))
+
+def vault_files(directory):
+    files = {}
+    for file_path in entry_paths(directory):
+        with open(file_path) as file:
+            files[os.path.relpath(file_path, directory)] = file.read()
+    return files
+
+def test_backups_in_the_same_instant_get_their_own_names(backups, vault, monkeypatch):
+    monkeypatch.setattr(backup, "datetime", FrozenClock)
+    full_path, kind, _ = backups.create(entry_paths(vault), FULL)
+    assert kind == FULL
+
+    write_entry(vault, "Mirrors", date(2024, 3, 5), "A hall of mirrors")
+    incremental_path, kind, _ = backups.create(entry_paths(vault), INCREMENTAL)
+    assert kind == INCREMENTAL
+    assert incremental_path != full_path
+
+    with open(incremental_path + MANIFEST_SUFFIX) as file:
+        assert json.load(file)["base"] == os.path.basename(full_path)
+    assert backups.chain() == [full_path, incremental_path]
+
+def test_chain_restores_the_vault(backups, vault, tmp_path):
+    full_path, _, _ = backups.create(entry_paths(vault), FULL, "gzip", backup_format=TAR)
+    # Rewrites the first entry in place
+    write_entry(vault, "Ocean", date(2024, 1, 1), "Swimming under the ocean")
+    write_entry(vault, "Mirrors", date(2024, 3, 5), "A hall of mirrors")
+    incremental_path, _, _ = backups.create(entry_paths(vault), INCREMENTAL, "gzip", backup_format=TAR)
+    # Only what changed is in the incremental backup
+    assert sorted(ArchiveIndex(incremental_path).select()) == [
+        "2024/January/1/Ocean_20240101_000000_000000.txt",
+        "2024/March/5/Mirrors_20240305_000000_000000.txt",
+    ]
+
+    chain = backups.chain()
+    assert chain == [full_path, incremental_path]
+
+    # Newest backup first, like the handlers restore, so the edited entry wins
+    restored = str(tmp_path / "restored")
+    with BulkWriter() as writer:
+        for backup_path in reversed(chain):
+            ArchiveIndex(backup_path).extract(restored, writer=writer)
+    assert vault_files(restored) == vault_files(vault)
+
+def test_chain_refuses_a_loop(backups, vault):
+    full_path, _, _ = backups.create(entry_paths(vault), FULL)
+    manifest_path = full_path + MANIFEST_SUFFIX
+    with open(manifest_path) as file:
+        manifest = json.load(file)
+    # What a backup written in the same second as its base used to record
+    manifest["base"] = manifest["backup"]
+    with open(manifest_path, "w") as file:
+        json.dump(manifest, file)
+
+    with pytest.raises(ValueError, match="loops"):
+        backups.chain()
+
+def test_chain_reports_a_missing_base(backups, vault):
+    full_path, _, _ = backups.create(entry_paths(vault), FULL)
+    write_entry(vault, "Mirrors", date(2024, 3, 5), "A hall of mirrors")
+    backups.create(entry_paths(vault), INCREMENTAL)
+    os.remove(full_path)
+
+    with pytest.raises(FileNotFoundError, match="missing from the backup chain"):
+        backups.chain()
@@ -0,0 +1,75 @@
+# Cache tests
+# Checks that the entry cache stays within its count and byte bounds, evicting the least
+# recently used entries first
+# @RanbirSDeol
+# 10/18/2026
+
+# Classes
+from logic.cache import EntryCache
+
+class Loader:
+    # Entries are their own path, and each one weighs what sizes gives it
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.loads = []
+
+    def __call__(self, path):
+        self.loads.append(path)
+        return path.upper(), self.sizes[path]
+
+def test_hits_do_not_reload():
+    loader = Loader({"a": 1})
+    cache = EntryCache(loader)
+    assert cache.get("a") == "A"
+    assert cache.get("a") == "A"
+    assert loader.loads == ["a"]
+
+def test_byte_bound_evicts_least_recently_used():
+    loader = Loader({"a": 40, "b": 40, "c": 40})
+    cache = EntryCache(loader, max_entries=10, max_bytes=100)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")  # b is now the least recently used
+    cache.get("c")
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.total_bytes == 80 <= cache.max_bytes
+    cache.get("b")
+    assert loader.loads == ["a", "b", "c", "b"]
+
+def test_count_bound_evicts_least_recently_used():
+    loader = Loader({path: 1 for path in "abcd"})
+    cache = EntryCache(loader, max_entries=3)
+    for path in "abcd":
+        cache.get(path)
+    assert list(cache.entries) == ["b", "c", "d"]
+    assert cache.total_bytes == 3
+
+def test_an_oversized_entry_is_kept_alone():
+    loader = Loader({"a": 10, "huge": 500})
+    cache = EntryCache(loader, max_bytes=100)
+    cache.get("a")
+    cache.get("huge")
+    assert list(cache.entries) == ["huge"]
+    assert cache.total_bytes == 500
+
+def test_invalidate_and_clear_release_their_bytes():
+    loader = Loader({"a": 30, "b": 20})
+    cache = EntryCache(loader)
+    cache.get("a")
+    cache.get("b")
+    cache.invalidate("a")
+    assert list(cache.entries) == ["b"] and cache.total_bytes == 20
+    cache.get("a")
+    assert loader.loads == ["a", "b", "a"]
+    cache.clear()
+    assert not cache.entries and cache.total_bytes == 0
+
+def test_stale_prefetch_is_dropped():
+    loader = Loader({"a": 1})
+    cache = EntryCache(loader)
+    # A prefetch that started before the entry was edited
+    generation = cache.generation
+    cache.invalidate("a")
+    cache._store("a", "OLD", 1, generation)
+    assert "a" not in cache.entries
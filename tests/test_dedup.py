@@ -0,0 +1,59 @@
+# Dedup tests
+# Checks that sync skips entries already in the vault, by date and title or by content
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+from datetime import date
+
+import pytest
+
+# Classes
+from conftest import write_entry
+from logic.catalog import Catalog
+from logic.sync import DedupCache, file_key
+
+def open_entry(vault, name):
+    with Catalog(vault) as catalog:
+        (file_path,) = [path for path in catalog.list_paths() if name in path]
+    with open(file_path) as file:
+        return file.read()
+
+@pytest.fixture
+def cache(vault):
+    write_entry(vault, "Flying Dream", date(2024, 1, 5), "Over the  ocean", "Lucid", "MILD", "WBTB", 1)
+    write_entry(vault, "Stairs", date(2024, 2, 3), "[]")
+    with Catalog(vault) as catalog:
+        catalog.refresh()
+        return DedupCache(catalog.list_paths(), catalog.fingerprints())
+
+def test_file_key_ignores_the_timestamp_and_underscores(vault):
+    file_path = write_entry(vault, "Flying  Dream", date(2024, 1, 5), "", stamp=123456)
+    assert file_key(file_path) == ("2024-01-05", "flying dream")
+
+@pytest.mark.parametrize("title", ["Flying Dream", "flying_dream", "  FLYING   dream "])
+def test_same_date_and_title_is_seen(cache, title):
+    assert cache.seen(DedupCache.key("2024-01-05", title), "Something else entirely")
+
+def test_same_title_on_another_day_is_new(cache):
+    assert not cache.seen(DedupCache.key("2024-01-06", "Flying Dream"), "Something else entirely")
+
+def test_same_content_under_another_title_is_seen(cache, vault):
+    # Case and spacing of the body don't matter, the header fields do
+    renamed = "[ (Renamed) | (9 March, 2024) ]\n" + open_entry(vault, "Flying_Dream").split("\n", 1)[1].replace("Over the  ocean", "over THE ocean")
+    assert cache.seen(DedupCache.key("2024-03-09", "Renamed"), renamed)
+
+    other_technique = renamed.replace("Technique: MILD", "Technique: WILD")
+    assert not cache.seen(DedupCache.key("2024-03-09", "Renamed"), other_technique)
+
+def test_empty_entries_are_never_duplicates_by_content(cache, vault):
+    empty = open_entry(vault, "Stairs").replace("Stairs", "Other")
+    assert not cache.seen(DedupCache.key("2024-02-04", "Other"), empty)
+
+def test_added_entries_are_seen(cache, vault):
+    content = open_entry(vault, "Flying_Dream").replace("Over the  ocean", "Under the sea")
+    key = DedupCache.key("2024-04-01", "Sea")
+    assert not cache.seen(key, content)
+    cache.add(key, content)
+    assert cache.seen(key, "")
+    assert cache.seen(DedupCache.key("2024-04-02", "Sea again"), content)
@@ -0,0 +1,29 @@
+# Header tests
+# Checks that an entry's header is read from a bounded prefix of its file
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+from datetime import date
+
+# Classes
+from conftest import write_entry
+from logic.utils import HEADER_BYTES, Helpers
+
+def test_read_header_ignores_the_body(vault):
+    # A body far past the prefix, cut in the middle of a two byte character
+    body = "é" * (5 * HEADER_BYTES)
+    file_path = write_entry(vault, "Long Dream", date(2024, 3, 9), body, "Lucid", "MILD", "WBTB")
+
+    header = Helpers.read_header(file_path)
+    assert header.title == "Long Dream"
+    assert header.date == "9 March, 2024"
+    assert (header.dream_type, header.technique, header.sleep_cycle) == ("Lucid", "MILD", "WBTB")
+
+    with open(file_path) as file:
+        assert Helpers.parse_header(file.read()) == header
+
+def test_missing_fields_are_empty():
+    header = Helpers.parse_header("[ (Nap) | (1 May, 2024) ]")
+    assert header.title == "Nap" and header.date == "1 May, 2024"
+    assert header.dream_type == header.technique == header.sleep_cycle == ""
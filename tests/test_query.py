@@ -0,0 +1,67 @@
+# Query tests
+# Checks where date: ranges start and end, and that malformed dates are rejected
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+from datetime import date
+
+import pytest
+
+# Classes
+from conftest import write_entry
+from logic.catalog import Catalog
+from logic.query import EntryQuery, QueryError, date_range, parse_query, sign_filter
+from logic.search import SearchIndex
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024", ("2024", "2025")),
+    ("2024-12", ("2024-12", "2025-01")),
+    ("2024-01..2024-06", ("2024-01", "2024-07")),
+    ("2023..2024-02-29", ("2023", "2024-02-29~")),
+    ("2024-03..", ("2024-03", None)),
+    ("..2024-06", (None, "2024-07")),
+])
+def test_date_range_ends(value, expected):
+    assert date_range(value) == expected
+
+@pytest.mark.parametrize("value", ["2024/02", "24-01", "2024-13", "2024-00", "2024-01-32", "2023-02-29", "2024-1", "soon.."])
+def test_bad_dates_are_rejected(value):
+    with pytest.raises(QueryError):
+        date_range(value)
+
+def test_bad_dates_are_rejected_by_the_parser():
+    with pytest.raises(QueryError, match="2024-02-30"):
+        parse_query("type:Lucid date:2024-01..2024-02-30")
+
+@pytest.mark.parametrize("value, expected", [
+    ("Flying", ("Flying", None, None)),
+    ("Flying>50", ("Flying", ">", 50)),
+    ("Teeth Falling<=30%", ("Teeth Falling", "<=", 30)),
+])
+def test_sign_filter(value, expected):
+    assert sign_filter(value) == expected
+
+def test_parse_query_splits_every_part():
+    query = parse_query('type:Lucid cycle:"Nap 2" date:2024 sign:Flying>50 "over the" /fl[iy]/ ocean mood:calm')
+    assert query.fields == [("dream_type", "Lucid"), ("sleep_cycle", "Nap 2")]
+    assert query.dates == [("2024", "2025")]
+    assert query.signs == [("Flying", ">", 50)]
+    assert query.phrases == ["over the"]
+    assert query.regexes == ["fl[iy]"]
+    assert query.words == ["ocean", "mood:calm"]
+
+def test_date_filters_include_both_ends(vault):
+    days = [date(2023, 12, 31), date(2024, 1, 1), date(2024, 2, 29), date(2024, 3, 1)]
+    paths = [write_entry(vault, f"Entry {index}", day, "A dream") for index, day in enumerate(days)]
+    with Catalog(vault) as catalog:
+        catalog.refresh()
+        entry_query = EntryQuery(catalog, SearchIndex(catalog))
+
+        def found(text):
+            return {hit.path for hit in entry_query.run(text)}
+
+        assert found("date:2024-01..2024-02") == {paths[1], paths[2]}
+        assert found("date:..2024-01-01") == {paths[0], paths[1]}
+        assert found("date:2024-02-29..") == {paths[2], paths[3]}
+        assert found("date:2023") == {paths[0]}
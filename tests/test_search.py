@@ -0,0 +1,120 @@
+# Search tests
+# Checks that the trigram prefilter never drops an entry a full regex scan would find,
+# and that indexing a vault stays cheap in time and space
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import os
+import re
+import time
+import random
+from datetime import date, timedelta
+
+import pytest
+
+# Classes
+from conftest import write_entry
+from logic.catalog import Catalog, catalog_path, scan_entries
+from logic.search import SearchIndex, required_literals
+
+ENTRIES = [
+    "I was flying over the ocean again",
+    "Flying dream, then falling down the stairs",
+    "A dog taught me how to fly",
+    "fly fly fly, flying flyer",
+    "Dream of stairs and a dark city",
+    "dream  of  mirrors",
+    "No fl ying here, only walking",
+    "Über die Straße, then the ÉCOLE",
+]
+
+PATTERNS = [
+    r"flying",
+    r"\x66lying",
+    r"\N{LATIN SMALL LETTER F}lying",
+    r"\146lying",
+    r"(fly) \1",
+    r"(?x) f l y i n g",
+    r"(?i)FLYING",
+    r"(?i:fly)ing",
+    r"fly(ing|er)",
+    r"dream\s+of",
+    r"\bfly\b",
+    r"fl.ying",
+    r"école",
+    r"STRASSE",
+    r'"quoted"',
+]
+
+@pytest.fixture
+def catalog(vault):
+    paths = [
+        write_entry(vault, f"Entry {index}", date(2024, 1, 1) + timedelta(days=index), content)
+        for index, content in enumerate(ENTRIES)
+    ]
+    with Catalog(vault) as catalog:
+        catalog.refresh()
+        catalog.paths = paths
+        yield catalog
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_grep_matches_a_full_scan(catalog, pattern):
+    expected = set()
+    for file_path in catalog.paths:
+        with open(file_path) as file:
+            if re.search(pattern, file.read(), re.IGNORECASE):
+                expected.add(file_path)
+    assert {hit.path for hit in SearchIndex(catalog).grep(pattern)} == expected
+
+def test_rank_needs_every_word(catalog):
+    search_index = SearchIndex(catalog)
+    assert {hit.path for hit in search_index.rank("dream stairs")} == {catalog.paths[1], catalog.paths[4]}
+    # fts5 operators are searched for like any other word
+    assert [hit.path for hit in search_index.rank("and")] == [catalog.paths[4]]
+    assert search_index.rank("ocean near") == []
+
+def test_snippets_highlight_the_pattern(catalog):
+    search_index = SearchIndex(catalog)
+    hits = search_index.rank("ocean")
+    snippet = search_index.snippets(hits, search_index.highlight_pattern("ocean"))[hits[0].entry_id]
+    assert [snippet.plain[span.start:span.end] for span in snippet.spans] == ["ocean"]
+
+def test_changes_reach_both_indexes(catalog):
+    search_index = SearchIndex(catalog)
+    os.remove(catalog.paths[0])
+    # Rewrites the second entry in place
+    write_entry(catalog.directory, "Entry 1", date(2024, 1, 2), "Swimming under the ocean")
+    assert catalog.refresh() == (0, 1, 1)
+
+    assert [hit.path for hit in search_index.rank("ocean")] == [catalog.paths[1]]
+    assert [hit.path for hit in search_index.grep("swimming under")] == [catalog.paths[1]]
+    assert [hit.path for hit in search_index.rank("stairs")] == [catalog.paths[4]]
+    assert [hit.path for hit in search_index.grep("stairs")] == [catalog.paths[4]]
+
+@pytest.mark.parametrize("pattern", [r"\x66lying", r"(fly) \1", r"(?x) f l y", r"\N{LATIN SMALL LETTER F}lying"])
+def test_escapes_with_arguments_require_nothing(pattern):
+    assert required_literals(pattern) == []
+
+def test_plain_text_is_still_required():
+    assert required_literals(r"\bflying\b over") == ["flying", " over"]
+
+def test_cold_scan_is_cheap(vault):
+    # 300 entries of about 3 KB, like a few months of long dreams
+    rng = random.Random(7)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 9))) for _ in range(5000)]
+    for index in range(300):
+        body = " ".join(rng.choice(words) for _ in range(430))
+        write_entry(vault, f"Dream {index}", date(2020, 1, 1) + timedelta(days=index % 1000), body, "Lucid", "MILD", "WBTB", index)
+
+    paths = [dir_entry.path for dir_entry in scan_entries(vault)]
+    started = time.perf_counter()
+    with Catalog(vault) as catalog:
+        catalog.refresh()
+    scanning = time.perf_counter() - started
+
+    vault_size = sum(os.path.getsize(file_path) for file_path in paths)
+    # A row per (trigram, entry) and per (word, entry) made the catalog 22 times the vault
+    # at about 18 ms an entry, the fts5 indexes keep it near 2.5 times at about 1.5 ms
+    assert os.path.getsize(catalog_path(vault)) < 4 * vault_size
+    assert scanning / len(paths) < 0.01
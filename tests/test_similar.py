@@ -0,0 +1,43 @@
+# Similar tests
+# Checks the MinHash permutations against exact integer arithmetic, and that near copies
+# of an entry are grouped together
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import random
+from datetime import date
+
+# Classes
+from conftest import write_entry
+from logic.catalog import Catalog
+from logic.similar import HASH_PRIME, MinHasher, SimilarityIndex
+
+def test_permutations_do_not_wrap():
+    hasher = MinHasher()
+    hashes = {0, 1, 12345, 2 ** 31, 2 ** 32 - 1}
+    # Python integers never overflow, so these are the true (a * x + b) % p
+    expected = [
+        min((int(a) * x + int(b)) % int(HASH_PRIME) for x in hashes)
+        for a, b in zip(hasher.a, hasher.b)
+    ]
+    assert hasher.signature(hashes).tolist() == expected
+
+def test_near_copies_are_clustered(vault):
+    rng = random.Random(3)
+    words = [f"word{index}" for index in range(400)]
+    original = " ".join(rng.choice(words) for _ in range(200))
+    # The same dream with its last word changed, and an unrelated one
+    copy = original.rsplit(" ", 1)[0] + " ending"
+    other = " ".join(rng.choice(words) for _ in range(200))
+    paths = [
+        write_entry(vault, "Original", date(2024, 1, 1), original),
+        write_entry(vault, "Copy", date(2024, 1, 2), copy, stamp=1),
+        write_entry(vault, "Other", date(2024, 1, 3), other, stamp=2),
+    ]
+
+    with Catalog(vault) as catalog:
+        catalog.refresh()
+        clusters = SimilarityIndex(catalog).clusters()
+    assert [[entry.path for entry in cluster] for cluster in clusters] == [paths[:2]]
+    assert clusters[0][1].similarity >= 0.9
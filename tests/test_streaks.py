@@ -0,0 +1,46 @@
+# Streak tests
+# Checks the runs and gaps of the day bitmap, across month and year boundaries
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+from datetime import date, timedelta
+
+# Classes
+from logic.streaks import DayIndex, StreakStats
+
+def days_from(first, count):
+    return [first + timedelta(days=offset) for offset in range(count)]
+
+def test_runs_cross_month_and_year_boundaries():
+    # 29 December to 2 January, then 27 February to 2 March of a leap year
+    index = DayIndex(days_from(date(2023, 12, 29), 5) + days_from(date(2024, 2, 27), 5))
+    stats = index.stats(today=date(2024, 3, 3))
+    # Gaps count the missing days: 3 January to 26 February
+    assert stats == StreakStats(current=5, longest=5, days=10, gaps=1, longest_gap=55)
+
+def test_current_streak_ends_after_a_missed_day():
+    index = DayIndex(["2024-01-30", "2024-01-31", "2024-02-01"])
+    assert index.stats(today=date(2024, 2, 2)).current == 3
+    assert index.stats(today=date(2024, 2, 3)).current == 0
+    assert index.stats(today=date(2024, 2, 3)).longest == 3
+
+def test_older_days_shift_the_bitmap():
+    # Added newest first, so every day lands before the origin
+    index = DayIndex(reversed(days_from(date(2023, 12, 25), 10)))
+    index.add("2023-11-30")
+    assert index.origin == date(2023, 11, 30)
+    assert date(2024, 1, 3) in index and date(2023, 12, 24) not in index
+    assert index.stats(today=date(2024, 1, 4)) == StreakStats(current=10, longest=10, days=11, gaps=1, longest_gap=24)
+
+def test_removing_a_day_splits_its_run():
+    index = DayIndex(days_from(date(2024, 12, 30), 5))
+    index.remove("2025-01-01")
+    assert "2025-01-01" not in index
+    assert index.stats(today=date(2025, 1, 3)) == StreakStats(current=2, longest=2, days=4, gaps=1, longest_gap=1)
+
+def test_no_days():
+    assert DayIndex().stats() == StreakStats(0, 0, 0, 0, 0)
+    index = DayIndex(["2024-05-01"])
+    index.remove("2024-05-01")
+    assert index.stats(today=date(2024, 5, 1)) == StreakStats(0, 0, 0, 0, 0)
@@ -0,0 +1,65 @@
+# Sync tests
+# Checks that sync files read backwards give the same lines and entries whatever the
+# block size, even blocks much smaller than a line
+# @RanbirSDeol
+# 10/18/2026
+
+# Modules
+import pytest
+
+# Classes
+from logic.sync import DREAM_FIELDS, ENTRY_DELIMITER, SEPARATOR, read_sync_entries, reverse_lines
+
+BLOCK_SIZES = [1, 2, 3, 5, 7, 64, 64 * 1024]
+
+def sync_entry(title, day, body, dream_type="Lucid"):
+    return (
+        f"{ENTRY_DELIMITER}\n[ ({title}) | ({day}) ]\n{SEPARATOR}\n"
+        f"Dream Type: {dream_type}\nTechnique: MILD\nSleep Cycle: WBTB\n{SEPARATOR}\n{body}\n"
+    )
+
+@pytest.fixture
+def sync_file(tmp_path):
+    file_path = tmp_path / "sync.txt"
+    file_path.write_text(
+        "Exported entries\n"
+        + sync_entry("Ocean", "1 January, 2024", "Flying over the ocean\nthen waking up")
+        + sync_entry("Empty", "2 January, 2024", "")
+        + sync_entry("Straße", "3 January, 2024", "Über die Straße — 夢の中で 🌊")
+    )
+    return str(file_path)
+
+@pytest.mark.parametrize("block_size", BLOCK_SIZES)
+def test_reverse_lines_match_the_file(sync_file, block_size):
+    with open(sync_file, encoding="utf-8") as file:
+        expected = file.read().split("\n")[:-1]
+    assert [line for line, _ in reverse_lines(sync_file, block_size)] == expected[::-1]
+
+@pytest.mark.parametrize("block_size", BLOCK_SIZES)
+def test_reverse_lines_count_bytes_read(sync_file, block_size):
+    reads = [read for _, read in reverse_lines(sync_file, block_size)]
+    assert reads == sorted(reads)
+    with open(sync_file, "rb") as file:
+        assert reads[-1] == len(file.read())
+
+@pytest.mark.parametrize("content, expected", [
+    ("", [""]),
+    ("one line", ["one line"]),
+    ("\n", [""]),
+    ("a\n\nb\n", ["b", "", "a"]),
+])
+@pytest.mark.parametrize("block_size", [1, 2, 64])
+def test_reverse_lines_edges(tmp_path, content, expected, block_size):
+    file_path = tmp_path / "lines.txt"
+    file_path.write_text(content)
+    assert [line for line, _ in reverse_lines(str(file_path), block_size)] == expected
+
+@pytest.mark.parametrize("block_size", BLOCK_SIZES)
+def test_entries_come_last_first(sync_file, block_size):
+    entries = [entry for entry, _ in read_sync_entries(sync_file, DREAM_FIELDS, block_size)]
+    # The entry without a body is skipped, the text before the first delimiter too
+    assert [entry["Title"] for entry in entries] == ["Straße", "Ocean"]
+    assert entries[0]["Body"] == "Über die Straße — 夢の中で 🌊"
+    assert entries[1]["Body"] == "Flying over the ocean\nthen waking up"
+    assert entries[1]["Date"] == "1 January, 2024"
+    assert (entries[1]["Dream Type"], entries[1]["Technique"], entries[1]["Sleep Cycle"]) == ("Lucid", "MILD", "WBTB")